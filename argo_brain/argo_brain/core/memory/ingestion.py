@@ -74,6 +74,80 @@ class IngestionManager:
             metadata_overrides=metadata_overrides,
         )
 
+    def ingest_documents(
+        self,
+        docs: Sequence[SourceDocument],
+        *,
+        ephemeral: bool = False,
+    ) -> None:
+        """Store several documents with one embed call and one write per namespace.
+
+        Chunking is cheap but the embedder has a fixed per-call cost
+        (tokenizer warm-up, GPU transfer) and the vector store a fixed
+        per-add cost, so batching across documents amortizes both.
+
+        Args:
+            docs: The documents to ingest.
+            ephemeral: If True, store in web_cache with TTL metadata
+        """
+        entries: List[tuple] = []
+        all_chunks: List[str] = []
+        for doc in docs:
+            self._trust_level_for_doc(doc)
+            body = doc.content()
+            if not body:
+                continue
+            namespace = self._namespace_for_source_type(doc.source_type)
+            chunks = self._chunk_text(body)
+            if not chunks:
+                continue
+            metadata_overrides: Metadata = {}
+            if ephemeral:
+                namespace = self.config.collections.web_cache
+                metadata_overrides["fetched_at"] = int(time.time())
+            entries.append((namespace, doc, chunks, metadata_overrides))
+            all_chunks.extend(chunks)
+        if not all_chunks:
+            return
+
+        embeddings = self.embedder(all_chunks)
+        if not embeddings:
+            return
+        vectors = np.array(embeddings, dtype=float)
+
+        # Regroup the flat embedding matrix per namespace so each namespace
+        # gets a single add() regardless of how many documents fed it.
+        batches: Dict[str, Dict[str, list]] = {}
+        timestamp = int(time.time())
+        offset = 0
+        for namespace, doc, chunks, metadata_overrides in entries:
+            batch = batches.setdefault(
+                namespace, {"texts": [], "rows": [], "metadatas": [], "ids": []}
+            )
+            for idx, chunk in enumerate(chunks):
+                meta = self._base_metadata(doc)
+                meta.update(
+                    {
+                        "chunk_index": idx,
+                        "ingested_ts": timestamp,
+                    }
+                )
+                if metadata_overrides:
+                    meta.update(metadata_overrides)
+                batch["texts"].append(chunk)
+                batch["metadatas"].append(meta)
+                batch["ids"].append(self._chunk_id(doc, idx))
+            batch["rows"].extend(range(offset, offset + len(chunks)))
+            offset += len(chunks)
+        for namespace, batch in batches.items():
+            self.vector_store.add(
+                namespace=namespace,
+                texts=batch["texts"],
+                embeddings=vectors[batch["rows"]],
+                metadatas=batch["metadatas"],
+                ids=batch["ids"],
+            )
+
     def _upsert_chunks(
         self,
         *,
@@ -116,16 +190,17 @@ class IngestionManager:
         cleaned = text.strip()
         if not cleaned:
             return []
-        chunks: List[str] = []
-        start = 0
         length = len(cleaned)
-        while start < length:
-            end = min(start + self.chunk_size, length)
-            chunks.append(cleaned[start:end])
-            if end >= length:
-                break
-            start = max(0, end - self.chunk_overlap)
-        return chunks
+        step = self.chunk_size - self.chunk_overlap
+        if step <= 0:
+            # Degenerate configuration; one chunk avoids a non-advancing loop.
+            return [cleaned]
+        # Chunk boundaries are pure index arithmetic, so compute them in one
+        # vectorized pass: a start is kept while it still adds new text
+        # (start < length - overlap), plus the initial chunk.
+        starts = np.arange(0, max(length - self.chunk_overlap, 1), step, dtype=np.int64)
+        ends = np.minimum(starts + self.chunk_size, length)
+        return [cleaned[s:e] for s, e in zip(starts.tolist(), ends.tolist())]
 
     def _base_metadata(self, doc: SourceDocument) -> Metadata:
         metadata = dict(doc.metadata)
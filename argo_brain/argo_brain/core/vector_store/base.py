@@ -54,6 +54,20 @@ class VectorStore(ABC):
     ) -> int:
         """Delete documents matching the ids or filters and return count."""
 
+    def query_ids(
+        self,
+        namespace: str,
+        filters: Optional[Metadata] = None,
+        limit: int = 1000,
+        offset: int = 0,
+    ) -> List[str]:
+        """Return ids of documents matching the filters, one page at a time.
+
+        Default implementation returns an empty list. Subclasses should
+        override for backends that support metadata-filtered id listing.
+        """
+        return []
+
     def get_by_id(
         self,
         namespace: str,
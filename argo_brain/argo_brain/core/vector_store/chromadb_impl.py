@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+import sqlite3
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 from chromadb import PersistentClient
@@ -11,18 +15,65 @@ from chromadb.api.models.Collection import Collection
 
 from .base import Document, Metadata, VectorStore
 
+# Shared sentinel for rows without metadata; treated as read-only by callers,
+# so one dict can serve every such row instead of allocating per document.
+_EMPTY_METADATA: Metadata = {}
+
 
 class ChromaVectorStore(VectorStore):
     """Concrete VectorStore implementation backed by ChromaDB."""
 
+    #: Seconds concurrent callers of query_batched wait to be coalesced into
+    #: one multi-embedding Chroma query.
+    BATCH_WINDOW_S = 0.01
+
     def __init__(self, path: Path) -> None:
+        self._tune_sqlite(path)
         self._client = PersistentClient(path=str(path))
         self._collections: Dict[str, Collection] = {}
+        self._collections_lock = threading.Lock()
+        # Pending microbatch queues, keyed by (namespace, filters, k) so only
+        # compatible queries are merged. Only touched from the event loop.
+        self._pending_queries: Dict[Tuple, List[Tuple[np.ndarray, asyncio.Future]]] = {}
+
+    @staticmethod
+    def _tune_sqlite(path: Path) -> None:
+        """Switch Chroma's backing SQLite database to WAL before opening it.
+
+        journal_mode persists in the database file, so one short-lived
+        connection made ahead of PersistentClient is enough: Chroma's own
+        connections then inherit WAL, letting retrieval reads proceed
+        concurrently with ingestion writes instead of serializing behind
+        the rollback journal. While here, fold the accumulated WAL back
+        and refresh planner statistics.
+        """
+        db_file = path / "chroma.sqlite3"
+        if not db_file.exists():
+            return  # First run: Chroma creates the database itself.
+        try:
+            conn = sqlite3.connect(db_file)
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+                conn.execute("PRAGMA optimize")
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            pass  # Best effort; Chroma still works with default settings.
 
     def _get_collection(self, namespace: str) -> Collection:
-        if namespace not in self._collections:
-            self._collections[namespace] = self._client.get_or_create_collection(name=namespace)
-        return self._collections[namespace]
+        # Double-checked locking: the hot path is a single lock-free dict
+        # lookup, while concurrent first access for a namespace performs
+        # get_or_create_collection exactly once.
+        collection = self._collections.get(namespace)
+        if collection is not None:
+            return collection
+        with self._collections_lock:
+            collection = self._collections.get(namespace)
+            if collection is None:
+                collection = self._client.get_or_create_collection(name=namespace)
+                self._collections[namespace] = collection
+            return collection
 
     def add(
         self,
@@ -60,10 +111,20 @@ class ChromaVectorStore(VectorStore):
             n_results=k,
             where=filters,
         )
-        documents = response.get("documents", [[]])[0] or []
-        metadata = response.get("metadatas", [[]])[0] or []
-        ids = response.get("ids", [[]])[0] or []
-        distances = response.get("distances", [[]])[0] or []
+        return self._rows_to_documents(response, 0)
+
+    @staticmethod
+    def _response_column(response: Dict, key: str, index: int) -> List:
+        rows = response.get(key) or []
+        return (rows[index] or []) if index < len(rows) else []
+
+    @classmethod
+    def _rows_to_documents(cls, response: Dict, index: int) -> List[Document]:
+        """Convert one query's slice of a (possibly multi-query) Chroma response."""
+        documents = cls._response_column(response, "documents", index)
+        metadata = cls._response_column(response, "metadatas", index)
+        ids = cls._response_column(response, "ids", index)
+        distances = cls._response_column(response, "distances", index)
         results: List[Document] = []
         for doc, meta, doc_id, distance in zip(documents, metadata, ids, distances):
             # Convert distance to similarity score (higher is better)
@@ -75,13 +136,73 @@ class ChromaVectorStore(VectorStore):
             results.append(
                 Document(
                     id=doc_id,
-                    text=doc or "",
+                    text=doc if doc is not None else "",
                     score=similarity,
-                    metadata=meta or {},
+                    # Explicit None check: an empty-but-valid metadata dict is
+                    # falsy and must not be replaced; missing rows share one
+                    # sentinel rather than a fresh dict each.
+                    metadata=meta if meta is not None else _EMPTY_METADATA,
                 )
             )
         return results
 
+    async def query_batched(
+        self,
+        namespace: str,
+        query_embedding: np.ndarray,
+        k: int = 5,
+        filters: Optional[Metadata] = None,
+    ) -> List[Document]:
+        """Async variant of query() that coalesces concurrent callers.
+
+        Chroma accepts multiple query embeddings per call; concurrent
+        requests arriving within BATCH_WINDOW_S that share a namespace,
+        filter set, and k are merged into one multi-query invocation and the
+        per-query result slices are fanned back out. Amortizes per-call
+        setup overhead under concurrent FastAPI sessions at the cost of up
+        to one batching window of extra latency.
+        """
+        loop = asyncio.get_running_loop()
+        key = (
+            namespace,
+            json.dumps(filters, sort_keys=True) if filters else None,
+            k,
+        )
+        future: asyncio.Future = loop.create_future()
+        batch = self._pending_queries.get(key)
+        if batch is None:
+            self._pending_queries[key] = batch = []
+            loop.create_task(self._drain_query_batch(key, namespace, k, filters))
+        batch.append((query_embedding, future))
+        return await future
+
+    async def _drain_query_batch(
+        self,
+        key: Tuple,
+        namespace: str,
+        k: int,
+        filters: Optional[Metadata],
+    ) -> None:
+        await asyncio.sleep(self.BATCH_WINDOW_S)
+        batch = self._pending_queries.pop(key)
+        embeddings = [embedding.tolist() for embedding, _ in batch]
+        try:
+            collection = self._get_collection(namespace)
+            response = await asyncio.to_thread(
+                collection.query,
+                query_embeddings=embeddings,
+                n_results=k,
+                where=filters,
+            )
+        except Exception as exc:  # noqa: BLE001 - propagate to every waiter
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for index, (_, future) in enumerate(batch):
+            if not future.done():
+                future.set_result(self._rows_to_documents(response, index))
+
     def delete(
         self,
         namespace: str,
@@ -95,6 +216,18 @@ class ChromaVectorStore(VectorStore):
             return len(ids)
         return 0
 
+    def query_ids(
+        self,
+        namespace: str,
+        filters: Optional[Metadata] = None,
+        limit: int = 1000,
+        offset: int = 0,
+    ) -> List[str]:
+        """List matching ids without materializing documents or embeddings."""
+        collection = self._get_collection(namespace)
+        response = collection.get(where=filters, limit=limit, offset=offset, include=[])
+        return response.get("ids") or []
+
     def get_by_id(
         self,
         namespace: str,
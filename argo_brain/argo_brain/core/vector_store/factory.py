@@ -2,39 +2,56 @@
 
 from __future__ import annotations
 
+import functools
 import logging
-from typing import Optional
 
 from ...config import AppConfig, CONFIG
 from .base import VectorStore
 from .chromadb_impl import ChromaVectorStore
 from .memory_impl import InMemoryVectorStore
 
-_VECTOR_STORE: Optional[VectorStore] = None
 _LOGGER = logging.getLogger("argo_brain.vector_store")
 
 
-def create_vector_store(config: AppConfig = CONFIG) -> VectorStore:
-    """Instantiate (or reuse) the configured VectorStore backend."""
+def _build_vector_store(config: AppConfig) -> VectorStore:
+    """Construct a VectorStore for the configured backend."""
 
-    global _VECTOR_STORE
-    if _VECTOR_STORE is not None:
-        return _VECTOR_STORE
     backend = config.vector_store.backend.lower()
     if backend in {"memory", "stub", "inmemory"}:
-        _VECTOR_STORE = InMemoryVectorStore()
-        return _VECTOR_STORE
+        return InMemoryVectorStore()
     if backend == "chroma":
         try:
-            _VECTOR_STORE = ChromaVectorStore(config.vector_store.path)
-            return _VECTOR_STORE
+            return ChromaVectorStore(config.vector_store.path)
         except Exception as exc:  # noqa: BLE001 - fallback to in-memory store for tests
             _LOGGER.warning(
                 "Failed to initialize Chroma backend, falling back to in-memory store: %s", exc
             )
-            _VECTOR_STORE = InMemoryVectorStore()
-            return _VECTOR_STORE
+            return InMemoryVectorStore()
     raise ValueError(f"Unsupported vector store backend: {config.vector_store.backend}")
 
 
+@functools.cache
+def _default_vector_store() -> VectorStore:
+    """Process-wide store for the default config.
+
+    functools.cache gives thread-safe lazy initialization without the
+    module-level global + branch the previous implementation used.
+    """
+
+    return _build_vector_store(CONFIG)
+
+
+def create_vector_store(config: AppConfig = CONFIG) -> VectorStore:
+    """Instantiate (or reuse) the configured VectorStore backend.
+
+    Callers using the default config share one memoized instance; an
+    explicit config always gets a store built from that config (previously
+    it silently received whatever store was created first).
+    """
+
+    if config is CONFIG:
+        return _default_vector_store()
+    return _build_vector_store(config)
+
+
 __all__ = ["create_vector_store"]
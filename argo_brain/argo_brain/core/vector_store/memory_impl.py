@@ -91,15 +91,39 @@ class InMemoryVectorStore(VectorStore):
     def _matches_filters(self, metadata: Metadata, filters: Metadata) -> bool:
         for key, value in filters.items():
             if isinstance(value, dict):
-                # support simple $gt comparisons used in codebase
-                if "$gt" in value:
-                    if not float(metadata.get(key, 0)) > float(value["$gt"]):
+                # Support the simple $gt/$lt comparisons used in the
+                # codebase. Mirror Chroma: a document missing the key never
+                # matches a comparison (treating it as 0 would sweep every
+                # untagged document into $lt-based cleanup deletes).
+                if "$gt" in value or "$lt" in value:
+                    if key not in metadata:
+                        return False
+                    current = float(metadata[key])
+                    if "$gt" in value and not current > float(value["$gt"]):
+                        return False
+                    if "$lt" in value and not current < float(value["$lt"]):
                         return False
                 continue
             if metadata.get(key) != value:
                 return False
         return True
 
+    def query_ids(
+        self,
+        namespace: str,
+        filters: Optional[Metadata] = None,
+        limit: int = 1000,
+        offset: int = 0,
+    ) -> List[str]:
+        """Return one page of ids whose metadata matches the filters."""
+        docs = self._namespaces.get(namespace, [])
+        matching = [
+            doc.id
+            for doc in docs
+            if not filters or self._matches_filters(doc.metadata, filters)
+        ]
+        return matching[offset : offset + limit]
+
     def get_by_id(
         self,
         namespace: str,
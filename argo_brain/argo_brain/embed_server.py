@@ -0,0 +1,69 @@
+"""Warm embedding service so short CLI runs skip the model load.
+
+Every CLI invocation that embeds a handful of chunks (rag_core, the
+ingestion scripts under cron) otherwise pays the full SentenceTransformer
+weight load and CUDA init, which dominates wall time for short runs. This
+tiny FastAPI app holds the model resident and serves embeddings over
+localhost; ``embeddings.embed_texts`` uses it transparently when it is up
+and falls back to in-process inference when it is not.
+
+Run with:
+    python -m argo_brain.embed_server
+"""
+
+from __future__ import annotations
+
+import os
+from typing import List
+
+import uvicorn
+from fastapi import FastAPI
+from pydantic import BaseModel, Field
+
+DEFAULT_HOST = os.getenv("ARGO_EMBED_HOST", "127.0.0.1")
+DEFAULT_PORT = int(os.getenv("ARGO_EMBED_PORT", "8089"))
+
+app = FastAPI(title="Argo Brain Embed Server", version="0.1.0")
+
+
+class EmbedRequest(BaseModel):
+    """Payload for embedding requests."""
+
+    texts: List[str] = Field(..., description="Texts to embed as dense vectors")
+
+
+class EmbedResponse(BaseModel):
+    """Embedding vectors, row-aligned with the request texts."""
+
+    embeddings: List[List[float]]
+
+
+class HealthResponse(BaseModel):
+    status: str
+
+
+@app.get("/health", response_model=HealthResponse)
+async def health() -> HealthResponse:
+    return HealthResponse(status="ok")
+
+
+@app.post("/embed", response_model=EmbedResponse)
+async def embed(request: EmbedRequest) -> EmbedResponse:
+    # Imported lazily so the app object can be built (and /health served)
+    # while the model is still loading on first use.
+    from argo_brain.embeddings import embed_texts_local
+
+    return EmbedResponse(embeddings=embed_texts_local(request.texts))
+
+
+def main() -> None:
+    """Run the embed server, warming the model before serving."""
+
+    from argo_brain.embeddings import embed_texts_local
+
+    embed_texts_local(["warmup"])
+    uvicorn.run(app, host=DEFAULT_HOST, port=DEFAULT_PORT)
+
+
+if __name__ == "__main__":
+    main()
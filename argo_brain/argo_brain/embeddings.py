@@ -2,30 +2,94 @@
 
 from __future__ import annotations
 
+import os
 from functools import lru_cache
-from typing import Iterable, List, Sequence
+from typing import Iterable, List, Optional, Sequence
 
+import numpy as np
+import requests
 from sentence_transformers import SentenceTransformer
 
 from .config import CONFIG
 
+# Warm embed server (see embed_server.py). When it is reachable, embedding
+# becomes a localhost POST instead of a per-process model load. One failed
+# attempt disables it for the rest of the process so offline runs don't pay
+# a connection attempt per call; set ARGO_EMBED_SERVER_URL=off to skip it.
+_EMBED_SERVER_URL = os.getenv("ARGO_EMBED_SERVER_URL") or (
+    f"http://{os.getenv('ARGO_EMBED_HOST', '127.0.0.1')}:"
+    f"{os.getenv('ARGO_EMBED_PORT', '8089')}/embed"
+)
+_SERVER_DOWN = os.getenv("ARGO_EMBED_SERVER_URL", "") == "off"
+_SESSION = requests.Session()
+
 
 @lru_cache(maxsize=1)
 def _get_model() -> SentenceTransformer:
-    """Return a cached embedding model instance."""
+    """Return a cached embedding model instance.
+
+    On CUDA the model loads in FP16 - halving weight bandwidth with no
+    measurable quality change for retrieval embeddings - and encode() can
+    use a much larger batch to fill the GPU.
+    """
 
+    import torch
+
+    if torch.cuda.is_available():
+        return SentenceTransformer(
+            CONFIG.embed_model,
+            device="cuda",
+            model_kwargs={"torch_dtype": torch.float16},
+        )
     return SentenceTransformer(CONFIG.embed_model)
 
 
+def _embed_remote(texts: List[str]) -> Optional[List[List[float]]]:
+    """Try the warm embed server; return None when it is unavailable."""
+
+    global _SERVER_DOWN
+    if _SERVER_DOWN:
+        return None
+    try:
+        response = _SESSION.post(_EMBED_SERVER_URL, json={"texts": texts}, timeout=120)
+        response.raise_for_status()
+        return response.json()["embeddings"]
+    except (requests.RequestException, KeyError, ValueError):
+        _SERVER_DOWN = True
+        return None
+
+
 def embed_texts(texts: Sequence[str]) -> List[List[float]]:
-    """Embed a collection of texts as dense vectors."""
+    """Embed a collection of texts as dense vectors.
+
+    Uses the warm embed server when one is running (skipping the in-process
+    model load entirely), otherwise falls back to local inference.
+    """
+
+    cleaned = [text.strip() for text in texts if text and text.strip()]
+    if not cleaned:
+        return []
+    remote = _embed_remote(cleaned)
+    if remote is not None:
+        return remote
+    return embed_texts_local(cleaned)
+
+
+def embed_texts_local(texts: Sequence[str]) -> List[List[float]]:
+    """Embed texts with the in-process model (used by the embed server)."""
 
     cleaned = [text.strip() for text in texts if text and text.strip()]
     if not cleaned:
         return []
     model = _get_model()
-    embeddings = model.encode(cleaned, batch_size=8, normalize_embeddings=True)
-    return [vec.tolist() if hasattr(vec, "tolist") else list(vec) for vec in embeddings]
+    # batch_size=8 underfills both GPU SMs and CPU vector units for bge-m3;
+    # larger batches amortize the per-batch tokenize/transfer overhead.
+    batch_size = 64 if model.device.type == "cuda" else 32
+    embeddings = model.encode(cleaned, batch_size=batch_size, normalize_embeddings=True)
+    # np.asarray is a no-copy view for the usual 2-D ndarray return and also
+    # stacks list-of-arrays returns; one tolist() then converts every row in
+    # a single C call instead of a per-row hasattr branch and allocation.
+    return np.asarray(embeddings, dtype=np.float32).tolist()
 
 
 def embed_single(text: str) -> List[float]:
@@ -13,6 +13,20 @@ import requests
 
 from .config import CONFIG, LLMConfig
 
+try:
+    # orjson serializes the request payload and parses the (potentially
+    # hundreds of KB) completion response several times faster than stdlib
+    # json; fall back silently if it is not installed.
+    import orjson
+
+    _dumps = orjson.dumps  # returns bytes, which requests accepts as data=
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _loads = json.loads
+
 
 @dataclass
 class ChatMessage:
@@ -93,7 +107,7 @@ class LLMClient:
         try:
             response = self.session.post(
                 self.config.base_url,
-                data=json.dumps(payload),
+                data=_dumps(payload),
                 headers=self.headers,
                 timeout=self.config.request_timeout,
             )
@@ -130,7 +144,7 @@ class LLMClient:
                 f"llama-server returned {response.status_code}: {response.text[:2000]}"
             )
 
-        data = response.json()
+        data = _loads(response.content)
 
         # Extract token usage from llama-server response
         usage = data.get("usage", {})
@@ -173,8 +187,8 @@ class LLMClient:
                     func_name = func.get("name", "unknown")
                     # Arguments are JSON string, parse them
                     try:
-                        args = json.loads(func.get("arguments", "{}"))
-                    except json.JSONDecodeError:
+                        args = _loads(func.get("arguments", "{}"))
+                    except ValueError:
                         args = {}
 
                     # Build XML format
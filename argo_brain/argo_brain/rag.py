@@ -9,6 +9,8 @@ from typing import Any, Dict, List, Optional, Sequence
 import numpy as np
 import requests
 import trafilatura
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .config import CONFIG
 from .core.memory.document import SourceDocument
@@ -59,15 +61,79 @@ def ingest_text(
     _INGESTION_MANAGER.ingest_document(doc, ephemeral=False)
 
 
+@dataclass
+class IngestItem:
+    """A single pending archival ingestion, queued for a batched upsert."""
+
+    text: str
+    source_id: str
+    source_type: str
+    url: Optional[str] = None
+    extra_meta: Optional[Dict[str, Any]] = None
+
+
+def ingest_text_batch(items: Sequence[IngestItem]) -> None:
+    """Ingest several texts with one embedding call and one upsert per namespace.
+
+    Equivalent to calling ingest_text per item, but the per-call embedder and
+    vector store overhead is paid once for the whole batch. Used by bulk
+    pipelines like history ingestion.
+    """
+    docs = [
+        SourceDocument(
+            id=item.source_id,
+            source_type=item.source_type,
+            raw_text=item.text,
+            cleaned_text=item.text,
+            url=item.url,
+            metadata=item.extra_meta or {},
+        )
+        for item in items
+    ]
+    if docs:
+        _INGESTION_MANAGER.ingest_documents(docs, ephemeral=False)
+
+
+# Shared pooled session: bulk ingestion fetches many URLs sequentially, and
+# per-call requests.get pays a fresh TCP+TLS handshake each time. Keep-alive
+# pooling plus bounded retries on transient gateway errors removes those
+# round trips from the critical path.
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+    ),
+)
+_HTTP_SESSION.mount(
+    "http://",
+    HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+    ),
+)
+
+
 def _fetch_html(url: str, timeout: int = 25) -> str:
-    headers = {"User-Agent": "ArgoBrain/1.0 (+https://argo-brain.local)"}
-    response = requests.get(url, timeout=timeout, headers=headers)
+    headers = {
+        "User-Agent": "ArgoBrain/1.0 (+https://argo-brain.local)",
+        # Compressed transfer: requests decompresses before trafilatura sees it.
+        "Accept-Encoding": "gzip, deflate",
+    }
+    response = _HTTP_SESSION.get(url, timeout=timeout, headers=headers)
     response.raise_for_status()
     return response.text
 
 
-def ingest_url(url: str) -> None:
-    """Download a URL, extract its article text, and ingest it."""
+def fetch_article_text(url: str) -> str:
+    """Download a URL and extract its main article text.
+
+    Split out from ingest_url so callers can run the network-bound fetch on
+    worker threads and keep the embed/persist step single-threaded.
+    """
 
     if not url.startswith(("http://", "https://")):
         raise ValueError(f"Only http(s) URLs are supported: {url}")
@@ -75,6 +141,13 @@ def ingest_url(url: str) -> None:
     extracted = trafilatura.extract(html, include_comments=False, include_tables=False)
     if not extracted:
         raise RuntimeError(f"Could not extract main content from {url}")
+    return extracted
+
+
+def ingest_url(url: str) -> None:
+    """Download a URL, extract its article text, and ingest it."""
+
+    extracted = fetch_article_text(url)
     ingest_text(text=extracted, source_id=url, source_type="web_page", url=url)
 
 
@@ -21,7 +21,7 @@ from __future__ import annotations
 import ast
 import json
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 import logging
 
@@ -264,6 +264,28 @@ class XMLToolParser:
         except (ValueError, SyntaxError):
             return param_value
 
+    def iter_tool_calls(self, chunks: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """Incrementally extract tool calls from a stream of text chunks.
+
+        Unlike calling :meth:`extract_tool_calls` on a growing buffer (which
+        re-scans the whole text on every chunk, O(n²) over the generation),
+        this keeps only the unparsed tail between chunks and scans each byte
+        once.
+
+        Args:
+            chunks: Iterable of text fragments as produced by a streaming
+                LLM backend.
+
+        Yields:
+            Parsed tool calls in the same format as extract_tool_calls.
+        """
+        streamer = StreamingXMLToolParser(self)
+        for chunk in chunks:
+            yield from streamer.feed(chunk)
+        # The stream may end inside an unterminated <tool_call> block, which
+        # extract_tool_calls accepts; flush the tail so both paths agree.
+        yield from streamer.flush()
+
     def format_tool_for_prompt(
         self, tool_name: str, description: str, parameters: Dict[str, Any]
     ) -> str:
@@ -305,3 +327,71 @@ class XMLToolParser:
         lines.append("</function>")
 
         return "\n".join(lines)
+
+
+class StreamingXMLToolParser:
+    """Stateful parser that extracts tool calls from a growing token stream.
+
+    Maintains a sliding buffer of text since the last complete
+    ``</tool_call>`` so each incoming chunk is scanned once instead of
+    re-scanning the entire generation.
+    """
+
+    def __init__(self, parser: Optional[XMLToolParser] = None) -> None:
+        self._parser = parser or XMLToolParser()
+        self._buffer = ""
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """Append a chunk and return any newly completed tool calls.
+
+        Args:
+            chunk: Next text fragment from the LLM stream
+
+        Returns:
+            Parsed tool calls completed by this chunk (possibly empty)
+        """
+        self._buffer += chunk
+        start_tag = self._parser.tool_call_start
+        end_tag = self._parser.tool_call_end
+
+        calls: List[Dict[str, Any]] = []
+        search_from = 0
+        while True:
+            start = self._buffer.find(start_tag, search_from)
+            if start == -1:
+                # No open tag left; keep only a possible partial tag at the tail.
+                self._buffer = self._tail_after(search_from)
+                return calls
+
+            end = self._buffer.find(end_tag, start + len(start_tag))
+            if end == -1:
+                # Incomplete tool call: retain from its opening tag onward.
+                self._buffer = self._buffer[start:]
+                return calls
+
+            call_text = self._buffer[start + len(start_tag):end]
+            parsed = self._parser._parse_function_call(call_text)
+            if parsed:
+                calls.append(parsed)
+            search_from = end + len(end_tag)
+
+    def flush(self) -> List[Dict[str, Any]]:
+        """Parse any trailing unterminated tool call and reset the buffer.
+
+        Call once the stream has ended; mirrors extract_tool_calls' handling
+        of a final ``<tool_call>`` block with no closing tag.
+        """
+        remainder, self._buffer = self._buffer, ""
+        if self._parser.function_prefix not in remainder:
+            return []
+        return self._parser.extract_tool_calls(remainder)
+
+    def _tail_after(self, search_from: int) -> str:
+        """Keep any trailing prefix of ``<tool_call>`` so a tag split across
+        chunks is not lost."""
+        start_tag = self._parser.tool_call_start
+        tail_window = self._buffer[max(search_from, len(self._buffer) - len(start_tag) + 1):]
+        for i in range(len(tail_window)):
+            if start_tag.startswith(tail_window[i:]):
+                return tail_window[i:]
+        return ""
@@ -3,8 +3,22 @@
 from __future__ import annotations
 
 import json
+import re
 from typing import Any, Optional
 
+# Matches a whole ``` / ```json fenced block so the fence can be stripped in
+# one pass instead of splitting and re-joining lines.
+_FENCE_RE = re.compile(r"^```(?:\w+)?[ \t]*\n?(.*?)\n?```\s*$", re.DOTALL)
+
+try:
+    # orjson parses typical LLM payloads several times faster than stdlib
+    # json; fall back silently if it is not installed.
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 
 def extract_json_object(text: str) -> Optional[Any]:
     """Attempt to parse the first JSON object embedded in arbitrary text.
@@ -19,64 +33,32 @@ def extract_json_object(text: str) -> Optional[Any]:
 
     # Remove simple ``` or ```json fences if present.
     if stripped.startswith("```"):
-        lines = stripped.splitlines()
-        if lines and lines[0].startswith("```"):
-            lines = lines[1:]
-        if lines and lines[-1].startswith("```"):
-            lines = lines[:-1]
-        stripped = "\n".join(lines).strip()
-
-    # Try parsing from the start if it begins with {
-    if stripped.startswith("{"):
+        fence_match = _FENCE_RE.match(stripped)
+        if fence_match:
+            stripped = fence_match.group(1).strip()
+
+    # Try the whole string only when it plausibly is a single object; a
+    # leading "{" with trailing prose would force a full speculative parse
+    # that is guaranteed to fail at end of input.
+    # (orjson's JSONDecodeError subclasses ValueError, as does stdlib's.)
+    if stripped.startswith("{") and stripped.endswith("}"):
         try:
-            return json.loads(stripped)
-        except json.JSONDecodeError:
+            return _loads(stripped)
+        except ValueError:
             # Fall through to extract first complete object
             pass
 
-    # Find the first complete JSON object by counting braces
+    # Decode the first complete JSON object in place. raw_decode does the
+    # brace/string/escape tracking in C and reports where the object ends,
+    # so no Python-level character loop is needed.
+    decoder = json.JSONDecoder()
     start = stripped.find("{")
-    if start == -1:
-        return None
-
-    brace_count = 0
-    end = start
-    in_string = False
-    escape_next = False
-
-    for i in range(start, len(stripped)):
-        char = stripped[i]
-
-        # Handle string escaping
-        if escape_next:
-            escape_next = False
-            continue
-        if char == '\\':
-            escape_next = True
-            continue
-
-        # Track if we're inside a string
-        if char == '"':
-            in_string = not in_string
-            continue
-
-        # Only count braces outside of strings
-        if not in_string:
-            if char == '{':
-                brace_count += 1
-            elif char == '}':
-                brace_count -= 1
-                if brace_count == 0:
-                    # Found the matching closing brace
-                    end = i
-                    break
-
-    if brace_count == 0 and end > start:
-        candidate = stripped[start : end + 1]
+    while start != -1:
         try:
-            return json.loads(candidate)
+            obj, _ = decoder.raw_decode(stripped, start)
+            return obj
         except json.JSONDecodeError:
-            return None
+            start = stripped.find("{", start + 1)
 
     return None
 
@@ -37,17 +37,39 @@ class PromptSanitizer:
     - Audit logging of modifications
     """
 
-    # Patterns that could break prompt structure or confuse the model
+    # Patterns that could break prompt structure or confuse the model.
+    # Compiled once at class definition so sanitize() skips the re module's
+    # per-call cache lookup on every pattern.
     DANGEROUS_PATTERNS = [
-        (r"<\|im_start\|>", "[IM_START]"),  # Chat template markers
-        (r"<\|im_end\|>", "[IM_END]"),
-        (r"\[SYSTEM\]", "[CONTEXT-SYSTEM]"),  # System message markers
-        (r"\[INST\]", "[CONTEXT-INST]"),
-        (r"\[/INST\]", "[CONTEXT-/INST]"),
-        (r"<<SYS>>", "[[SYS]]"),
-        (r"<</SYS>>", "[[/SYS]]"),
+        (re.compile(pattern, re.IGNORECASE), replacement)
+        for pattern, replacement in [
+            (r"<\|im_start\|>", "[IM_START]"),  # Chat template markers
+            (r"<\|im_end\|>", "[IM_END]"),
+            (r"\[SYSTEM\]", "[CONTEXT-SYSTEM]"),  # System message markers
+            (r"\[INST\]", "[CONTEXT-INST]"),
+            (r"\[/INST\]", "[CONTEXT-/INST]"),
+            (r"<<SYS>>", "[[SYS]]"),
+            (r"<</SYS>>", "[[/SYS]]"),
+        ]
     ]
 
+    # Single alternation over all dangerous markers so neutralization is one
+    # pass over the content instead of one scan per pattern. Named groups map
+    # each match back to its replacement (and audit label).
+    _MARKER_RE = re.compile(
+        "|".join(
+            f"(?P<m{i}>{pattern.pattern})"
+            for i, (pattern, _) in enumerate(DANGEROUS_PATTERNS)
+        ),
+        re.IGNORECASE,
+    )
+    _MARKER_REPLACEMENTS = {
+        f"m{i}": replacement for i, (_, replacement) in enumerate(DANGEROUS_PATTERNS)
+    }
+    _MARKER_LABELS = {
+        f"m{i}": pattern.pattern for i, (pattern, _) in enumerate(DANGEROUS_PATTERNS)
+    }
+
     # XML-like tags that should be escaped in user content
     XML_ESCAPE_MAP = {
         "<tool_call>": "&lt;tool_call&gt;",
@@ -64,6 +86,19 @@ class PromptSanitizer:
         "</synthesis>": "&lt;/synthesis&gt;",
     }
 
+    # One combined pattern over every escapable tag so the escape step is a
+    # single scan+copy instead of one full str.replace pass per tag.
+    # str.translate would be faster still, but it only handles
+    # single-character keys; every entry here is a multi-character tag (and
+    # a blanket '<' -> '&lt;' fallback would corrupt legitimate markup), so
+    # the combined regex is the right tool.
+    _XML_ESCAPE_RE = re.compile("|".join(re.escape(tag) for tag in XML_ESCAPE_MAP))
+
+    # Every dangerous marker and escapable tag starts with '<' or '['. If
+    # neither character appears, the content cannot need neutralization or
+    # escaping, so sanitize() can skip straight to truncation.
+    _TRIGGER_RE = re.compile(r"[<\[]")
+
     def __init__(
         self,
         max_length: int = 10000,
@@ -105,25 +140,54 @@ class PromptSanitizer:
         modifications = []
         sanitized = content
 
-        # Step 1: Neutralize dangerous markers
-        if self.neutralize_markers:
-            for pattern, replacement in self.DANGEROUS_PATTERNS:
-                if re.search(pattern, sanitized, re.IGNORECASE):
-                    sanitized = re.sub(pattern, replacement, sanitized, flags=re.IGNORECASE)
-                    modifications.append(f"neutralized: {pattern}")
+        # Fast path: most tool outputs contain no marker/tag trigger
+        # characters at all, so one linear scan replaces all the pattern work.
+        # Note: a parallel bytes-regex pipeline for ASCII input was
+        # considered and rejected - CPython already stores ASCII str at one
+        # byte per character, so the scans below run at bytes bandwidth and
+        # an encode/decode round trip would only add two full copies.
+        needs_scan = self._TRIGGER_RE.search(content) is not None
+
+        # Step 1: Neutralize dangerous markers (single pass over the content)
+        if needs_scan and self.neutralize_markers:
+            hit_groups: list[str] = []
+
+            def _neutralize(match: re.Match) -> str:
+                group = match.lastgroup
+                if group not in hit_groups:
+                    hit_groups.append(group)
+                return self._MARKER_REPLACEMENTS[group]
+
+            sanitized, neutralized_count = self._MARKER_RE.subn(_neutralize, sanitized)
+            if neutralized_count:
+                modifications.extend(
+                    f"neutralized: {self._MARKER_LABELS[group]}" for group in hit_groups
+                )
 
         # Step 2: Escape XML-like tags that could confuse tool parsing
-        if self.escape_xml:
-            for tag, escaped in self.XML_ESCAPE_MAP.items():
-                if tag in sanitized:
-                    sanitized = sanitized.replace(tag, escaped)
-                    modifications.append(f"escaped: {tag}")
+        # (single pass over the content)
+        if needs_scan and self.escape_xml:
+            hit_tags: list[str] = []
+
+            def _escape(match: re.Match) -> str:
+                tag = match.group(0)
+                if tag not in hit_tags:
+                    hit_tags.append(tag)
+                return self.XML_ESCAPE_MAP[tag]
+
+            sanitized, escaped_count = self._XML_ESCAPE_RE.subn(_escape, sanitized)
+            if escaped_count:
+                modifications.extend(f"escaped: {tag}" for tag in hit_tags)
 
         # Step 3: Truncate if too long
         was_truncated = False
         if self.max_length > 0 and len(sanitized) > self.max_length:
-            sanitized = sanitized[: self.max_length]
-            sanitized += f"\n\n[TRUNCATED - original: {original_length} chars, showing first {self.max_length}]"
+            # Build the final string in one allocation instead of
+            # slice-then-concat (which copies the truncated body twice).
+            sanitized = (
+                f"{sanitized[: self.max_length]}"
+                f"\n\n[TRUNCATED - original: {original_length} chars, showing first {self.max_length}]"
+            )
             was_truncated = True
             modifications.append(f"truncated: {original_length} → {self.max_length}")
 
@@ -185,11 +249,19 @@ def compute_prompt_hash(messages: list) -> str:
     Returns:
         12-character hash string
     """
-    content = "\n---\n".join(
-        f"{getattr(m, 'role', 'unknown')}: {getattr(m, 'content', str(m))}"
-        for m in messages
-    )
-    return hashlib.sha256(content.encode()).hexdigest()[:12]
+    # Feed the hasher incrementally rather than materializing the whole
+    # prompt as one string (and a second full copy when encoding it).
+    # BLAKE2b with a 6-byte digest yields exactly the 12 hex chars we need
+    # and hashes faster than SHA-256; this is a traceability ID, not a
+    # security primitive.
+    hasher = hashlib.blake2b(digest_size=6)
+    for i, m in enumerate(messages):
+        if i:
+            hasher.update(b"\n---\n")
+        hasher.update(str(getattr(m, "role", "unknown")).encode())
+        hasher.update(b": ")
+        hasher.update(str(getattr(m, "content", m)).encode())
+    return hasher.hexdigest()
 
 
 def compute_prompt_stats(messages: list) -> dict:
@@ -201,10 +273,25 @@ def compute_prompt_stats(messages: list) -> dict:
     Returns:
         Dictionary with prompt statistics
     """
-    total_chars = sum(len(getattr(m, "content", "")) for m in messages)
-    system_count = sum(1 for m in messages if getattr(m, "role", "") == "system")
-    user_count = sum(1 for m in messages if getattr(m, "role", "") == "user")
-    assistant_count = sum(1 for m in messages if getattr(m, "role", "") == "assistant")
+    # Single traversal: accumulate char/role counters and feed the hash in
+    # the same pass instead of iterating the message list five times.
+    total_chars = system_count = user_count = assistant_count = 0
+    hasher = hashlib.blake2b(digest_size=6)
+
+    for i, m in enumerate(messages):
+        role = getattr(m, "role", "")
+        content = getattr(m, "content", "")
+        total_chars += len(content)
+        system_count += role == "system"
+        user_count += role == "user"
+        assistant_count += role == "assistant"
+
+        # Mirror compute_prompt_hash's framing so both produce the same ID.
+        if i:
+            hasher.update(b"\n---\n")
+        hasher.update(str(getattr(m, "role", "unknown")).encode())
+        hasher.update(b": ")
+        hasher.update(str(getattr(m, "content", m)).encode())
 
     return {
         "message_count": len(messages),
@@ -212,11 +299,14 @@ def compute_prompt_stats(messages: list) -> dict:
         "system_messages": system_count,
         "user_messages": user_count,
         "assistant_messages": assistant_count,
-        "prompt_hash": compute_prompt_hash(messages),
+        "prompt_hash": hasher.hexdigest(),
     }
 
 
-# Default sanitizer instance
+# Default sanitizer instance. All combined patterns (_MARKER_RE,
+# _XML_ESCAPE_RE, _TRIGGER_RE) live on the class and are compiled when the
+# module is imported, so the first sanitize() call in a hot request pays no
+# compile cost; instances only carry the max_length/escape/neutralize flags.
 DEFAULT_SANITIZER = PromptSanitizer()
 
 
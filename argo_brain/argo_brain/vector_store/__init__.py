@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import functools
+
 from ..core.vector_store.base import Document, VectorStore
 from ..core.vector_store.factory import create_vector_store
 
 
+@functools.cache
 def get_vector_store() -> VectorStore:
     """Return a singleton vector store instance configured for Argo."""
 
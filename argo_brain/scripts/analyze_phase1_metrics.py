@@ -1,11 +1,53 @@
 #!/usr/bin/env python3
 """Parse Argo logs and extract Phase 1 metrics."""
 
+import json
+import mmap
+import os
 import re
+import sys
 from pathlib import Path
 from collections import defaultdict
 from datetime import datetime, timedelta
 
+# Patterns are compiled once here and operate on bytes: the log is scanned
+# through an mmap, so irrelevant regions are never decoded or split into
+# per-line str objects.
+PARALLEL_COUNT_RE = re.compile(
+    rb"PARALLEL_EXEC.*count=(\d+)|parallel_count=(\d+)|Executing (\d+) tools? in parallel"
+)
+
+# Single classifier over every interesting event marker: finditer over the
+# whole mapping touches each byte once and only event lines get any further
+# Python-level work. Field values are pulled with _field_value below so the
+# metrics stay robust to field order.
+EVENT_RE = re.compile(
+    rb"(?P<llm>LLM request completed)"
+    rb"|(?P<tool>Tool execution completed)"
+    rb"|(?P<par>PARALLEL_EXEC|tools in parallel|path=parallel)"
+)
+
+# key=value fields are literal prefixes followed by a run of word (or
+# numeric) bytes, so a C-level bytes.find plus a membership scan replaces a
+# full regex walk per field per event line.
+_WORD_BYTES = frozenset(b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_")
+_DIGIT_BYTES = frozenset(b"0123456789")
+_NUMERIC_BYTES = frozenset(b"0123456789.")
+
+
+def _field_value(line: bytes, key: bytes, charset: frozenset = _WORD_BYTES):
+    """Return the value bytes following ``key`` in ``line``, or None."""
+    i = line.find(key)
+    if i < 0:
+        return None
+    j = i + len(key)
+    k = j
+    n = len(line)
+    while k < n and line[k] in charset:
+        k += 1
+    return line[j:k] if k > j else None
+
+
 # Adjust path based on your setup
 log_file = Path.home() / "llm-argo/.argo_data/state/logs/argo_brain.log"
 
@@ -14,176 +56,436 @@ if not log_file.exists():
     print("Please adjust the path in this script or create logs by running Argo.")
     exit(1)
 
-metrics = {
-    "llm_calls": [],
-    "tool_executions": defaultdict(list),
-    "parallel_executions": [],
-    "token_usage": [],
-    "sessions": defaultdict(dict),
-}
+class Stat:
+    """Streaming count/sum/min/max accumulator (constant memory per metric)."""
+
+    __slots__ = ("n", "total", "mn", "mx")
+
+    def __init__(self):
+        self.n = 0
+        self.total = 0
+        self.mn = None
+        self.mx = None
+
+    def add(self, value):
+        self.n += 1
+        self.total += value
+        if self.mn is None or value < self.mn:
+            self.mn = value
+        if self.mx is None or value > self.mx:
+            self.mx = value
+
+    @property
+    def avg(self):
+        return self.total / self.n
+
+
+class ToolStat:
+    """Per-tool call counter plus a Stat over measured output sizes."""
+
+    __slots__ = ("calls", "output")
+
+    def __init__(self):
+        self.calls = 0
+        self.output = Stat()
+
+
+# Running accumulators replace the old sample lists: each metric needs only
+# count/sum/min/max for the report, so there is no reason to hold every
+# sample and re-scan it with sum()/min()/max() afterwards.
+llm_stat = Stat()
+prompt_stat = Stat()
+completion_stat = Stat()
+total_stat = Stat()
+parallel_stat = Stat()
+tool_stats = defaultdict(ToolStat)
 
 # Parse only recent logs (last 24 hours)
 cutoff_time = datetime.now() - timedelta(hours=24)
 
-print(f"Parsing logs from {log_file}...")
-print(f"Analyzing entries from the last 24 hours...\n")
 
-with open(log_file) as f:
-    for line in f:
-        # Parse timestamp
-        timestamp_match = re.match(r'^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})', line)
-        if timestamp_match:
-            try:
-                log_time = datetime.strptime(timestamp_match.group(1), "%Y-%m-%dT%H:%M:%S")
-                if log_time < cutoff_time:
-                    continue
-            except ValueError:
-                pass
+def _leading_timestamp(mm: mmap.mmap, line_offset: int):
+    """Parse the ISO timestamp starting a line into a (y, mo, d, h, mi, s) tuple.
+
+    The log's timestamp is fixed-width, so slicing the digits into ints is
+    far cheaper than strptime (which re-parses its format string and builds
+    a datetime every call). Tuples compare lexicographically, which is all
+    the cutoff search needs; lines without a timestamp return None without
+    constructing anything.
+    """
+    raw = mm[line_offset : line_offset + 19]
+    # Shape check by direct byte compares (bytes indexing yields ints):
+    # continuation lines fall through in a handful of comparisons without
+    # any regex machinery. int() below rejects any remaining non-digits.
+    if (
+        len(raw) < 19
+        or raw[4] != 0x2D  # '-'
+        or raw[7] != 0x2D  # '-'
+        or raw[10] != 0x54  # 'T'
+        or raw[13] != 0x3A  # ':'
+        or raw[16] != 0x3A  # ':'
+        or not raw[:4].isdigit()
+    ):
+        return None
+    try:
+        return (
+            int(raw[0:4]),
+            int(raw[5:7]),
+            int(raw[8:10]),
+            int(raw[11:13]),
+            int(raw[14:16]),
+            int(raw[17:19]),
+        )
+    except ValueError:
+        return None
+
+
+def _find_cutoff_offset(mm: mmap.mmap, cutoff: tuple) -> int:
+    """Locate the first line at or after the cutoff via binary search.
+
+    The log is append-only with monotonically increasing timestamps, so the
+    boundary is found in O(log N) probes instead of decoding and comparing
+    every historical line. Un-timestamped continuation lines (tracebacks)
+    are skipped forward to the next timestamped line during each probe.
+    """
+    lo, hi = 0, len(mm)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        line_offset = mm.rfind(b"\n", 0, mid) + 1
+        # Walk forward to a timestamped line for the comparison.
+        probe = line_offset
+        stamp = _leading_timestamp(mm, probe)
+        while stamp is None:
+            newline = mm.find(b"\n", probe)
+            if newline == -1:
+                break
+            probe = newline + 1
+            stamp = _leading_timestamp(mm, probe)
+        if stamp is None or stamp >= cutoff:
+            hi = line_offset
+        else:
+            line_end = mm.find(b"\n", probe)
+            lo = len(mm) if line_end == -1 else line_end + 1
+    return lo
+
+def _parse_events(mm: mmap.mmap, scan_from: int, size: int) -> list:
+    """Extract [epoch, kind, payload] event records from mm[scan_from:size].
+
+    Events carry their own timestamp so results can be checkpointed and the
+    24h window re-applied exactly on later runs.
+    """
+    events = []
+    line_start = mm.rfind
+    line_end = mm.find
+    last_epoch = None
+    # Log timestamps have one-second granularity, so bursts of events share
+    # the same stamp tuple; memoizing the last conversion skips rebuilding a
+    # datetime (and its local-time epoch) for every event line.
+    last_stamp = None
+
+    # finditer walks the scanned region once; only lines containing an
+    # event marker are sliced out and examined further.
+    previous_start = -1
+    for event in EVENT_RE.finditer(mm, scan_from, size):
+        # rfind returns -1 when the event sits on the very first scanned line.
+        start = max(line_start(b"\n", scan_from, event.start()) + 1, scan_from)
+        if start == previous_start:
+            # A line carrying several markers must still count once.
+            continue
+        previous_start = start
+        end = line_end(b"\n", event.end())
+        line = mm[start : end if end != -1 else size]
+        kind = event.lastgroup
+
+        stamp = _leading_timestamp(mm, start)
+        if stamp is not None and stamp != last_stamp:
+            last_stamp = stamp
+            last_epoch = datetime(*stamp).timestamp()
+        # Timestamps are monotone, so an un-timestamped event line inherits
+        # the previous line's epoch for windowing purposes.
+        epoch = last_epoch
 
         # LLM request completed with token counts
-        if "LLM request completed" in line:
-            elapsed_match = re.search(r"elapsed_ms=([\d.]+)", line)
-            prompt_match = re.search(r"prompt_tokens=(\d+)", line)
-            completion_match = re.search(r"completion_tokens=(\d+)", line)
-            total_match = re.search(r"total_tokens=(\d+)", line)
-
-            if elapsed_match:
-                metrics["llm_calls"].append(float(elapsed_match.group(1)))
-
-            if prompt_match and completion_match and total_match:
-                metrics["token_usage"].append({
-                    "prompt": int(prompt_match.group(1)),
-                    "completion": int(completion_match.group(1)),
-                    "total": int(total_match.group(1))
-                })
+        if kind == "llm":
+            raw_elapsed = _field_value(line, b"elapsed_ms=", _NUMERIC_BYTES)
+            raw_prompt = _field_value(line, b"prompt_tokens=", _DIGIT_BYTES)
+            raw_completion = _field_value(line, b"completion_tokens=", _DIGIT_BYTES)
+            raw_total = _field_value(line, b"total_tokens=", _DIGIT_BYTES)
+
+            elapsed = float(raw_elapsed) if raw_elapsed else None
+            tokens = None
+            if raw_prompt and raw_completion and raw_total:
+                tokens = [int(raw_prompt), int(raw_completion), int(raw_total)]
+            if elapsed is not None or tokens is not None:
+                events.append([epoch, "llm", elapsed, tokens])
 
         # Tool execution with output length
-        if "Tool execution completed" in line:
-            # Match both tool= and tool_name= for compatibility (log_setup uses tool=)
-            tool_match = re.search(r"tool=(\w+)", line) or re.search(r"tool_name=(\w+)", line)
-            output_match = re.search(r"output_length=(\d+)", line)
+        elif kind == "tool":
+            # tool_name= is checked first; tool= cannot false-match inside it.
+            raw_tool = _field_value(line, b"tool_name=") or _field_value(line, b"tool=")
+            raw_output = _field_value(line, b"output_length=", _DIGIT_BYTES)
 
-            if tool_match:
-                tool_name = tool_match.group(1)
-                output_len = int(output_match.group(1)) if output_match else None
-                metrics["tool_executions"][tool_name].append(output_len)
+            if raw_tool:
+                tool_name = raw_tool.decode("ascii")
+                output_len = int(raw_output) if raw_output else None
+                events.append([epoch, "tool", tool_name, output_len])
 
         # Parallel execution - match explicit markers
-        if "PARALLEL_EXEC" in line or "tools in parallel" in line or "path=parallel" in line:
-            count_match = (
-                re.search(r"PARALLEL_EXEC.*count=(\d+)", line)
-                or re.search(r"parallel_count=(\d+)", line)
-                or re.search(r"Executing (\d+) tools? in parallel", line)
-            )
+        elif kind == "par":
+            count_match = PARALLEL_COUNT_RE.search(line)
             if count_match:
-                metrics["parallel_executions"].append(int(count_match.group(1)))
+                count = next(g for g in count_match.groups() if g is not None)
+                events.append([epoch, "par", int(count)])
 
-# Calculate and display statistics
-print("=" * 70)
-print(" " * 20 + "PHASE 1 METRICS REPORT")
-print("=" * 70)
+    return events
+
+
+# The log is append-only, so parsed events are checkpointed alongside the
+# last-read byte offset; a re-run only scans the newly appended tail and
+# re-applies the 24h window to the cached events.
+checkpoint_file = log_file.with_name(log_file.name + ".analyze_ckpt.json")
+
+
+def _load_checkpoint() -> dict:
+    try:
+        with open(checkpoint_file) as fh:
+            data = json.load(fh)
+        if isinstance(data, dict):
+            return data
+    except (OSError, ValueError):
+        pass
+    return {}
+
+
+def _save_checkpoint(inode: int, offset: int, events: list) -> None:
+    try:
+        with open(checkpoint_file, "w") as fh:
+            json.dump({"inode": inode, "offset": offset, "events": events}, fh)
+    except OSError:
+        pass  # Checkpointing is best-effort; next run falls back to a full scan.
+
+
+# Below this size the ProcessPoolExecutor startup outweighs any speedup, so
+# small logs stay on the single-process path. Overridable for testing.
+PARALLEL_MIN_BYTES = int(os.environ.get("ARGO_ANALYZE_PARALLEL_MIN", 32 * 1024 * 1024))
+
+
+def _parse_span(span: tuple) -> list:
+    """Worker: re-mmap the log and parse one newline-aligned [lo, hi) span."""
+    lo, hi = span
+    span_fd = os.open(log_file, os.O_RDONLY)
+    try:
+        span_mm = mmap.mmap(span_fd, 0, access=mmap.ACCESS_READ)
+    finally:
+        os.close(span_fd)
+    try:
+        return _parse_events(span_mm, lo, hi)
+    finally:
+        span_mm.close()
+
+
+def _parallel_parse(mm: mmap.mmap, scan_from: int, size: int) -> list:
+    """Split the scan range across CPU cores; concatenation preserves order.
+
+    The classifier has no cross-line state, so newline-aligned spans can be
+    parsed independently and the per-span event lists joined in file order.
+    """
+    workers = os.cpu_count() or 1
+    span = size - scan_from
+    if span < PARALLEL_MIN_BYTES or workers < 2:
+        return _parse_events(mm, scan_from, size)
+    bounds = [scan_from]
+    for i in range(1, workers):
+        newline = mm.find(b"\n", scan_from + span * i // workers)
+        cut = size if newline == -1 else newline + 1
+        if cut > bounds[-1]:
+            bounds.append(cut)
+    if bounds[-1] != size:
+        bounds.append(size)
+    spans = list(zip(bounds, bounds[1:]))
+    if len(spans) < 2:
+        return _parse_events(mm, scan_from, size)
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=len(spans)) as pool:
+        return [event for chunk in pool.map(_parse_span, spans) for event in chunk]
+
+
+print(f"Parsing logs from {log_file}...")
+print(f"Analyzing entries from the last 24 hours...\n")
+
+log_stat = log_file.stat()
+checkpoint = _load_checkpoint()
+cached_events = []
+resume_offset = None
+if (
+    checkpoint.get("inode") == log_stat.st_ino
+    and isinstance(checkpoint.get("offset"), int)
+    and 0 <= checkpoint["offset"] <= log_stat.st_size
+):
+    cached_events = checkpoint.get("events") or []
+    resume_offset = checkpoint["offset"]
+
+fd = os.open(log_file, os.O_RDONLY)
+try:
+    fd_stat = os.fstat(fd)
+    size = fd_stat.st_size
+    if size == 0:
+        mm = None
+    else:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        if hasattr(mm, "madvise"):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+finally:
+    os.close(fd)
+
+new_events: list = []
+if mm is not None:
+    # Everything before the first in-window line can be skipped wholesale
+    # instead of decoded and compared per line; a valid checkpoint further
+    # narrows the scan to just the appended tail.
+    scan_from = _find_cutoff_offset(mm, cutoff_time.timetuple()[:6])
+    if resume_offset is not None:
+        scan_from = max(scan_from, resume_offset)
+    if scan_from and hasattr(mm, "madvise"):
+        # The skipped prefix will never be touched; let the kernel drop it.
+        page = mmap.PAGESIZE
+        if scan_from >= page:
+            mm.madvise(mmap.MADV_DONTNEED, 0, (scan_from // page) * page)
+
+    new_events = _parallel_parse(mm, scan_from, size)
+    mm.close()
+
+# Re-apply the 24h window across cached + fresh events, then checkpoint.
+cutoff_epoch = cutoff_time.timestamp()
+all_events = [
+    ev for ev in cached_events if ev[0] is None or ev[0] >= cutoff_epoch
+] + new_events
+# Record exactly what was scanned (fstat of the open fd), not the earlier
+# stat, so a write racing this run is re-read next time instead of skipped.
+_save_checkpoint(fd_stat.st_ino, size, all_events)
+
+for ev in all_events:
+    kind = ev[1]
+    if kind == "llm":
+        _, _, elapsed, tokens = ev
+        if elapsed is not None:
+            llm_stat.add(elapsed)
+        if tokens is not None:
+            prompt_stat.add(tokens[0])
+            completion_stat.add(tokens[1])
+            total_stat.add(tokens[2])
+    elif kind == "tool":
+        tool_stat = tool_stats[ev[2]]
+        tool_stat.calls += 1
+        if ev[3] is not None:
+            tool_stat.output.add(ev[3])
+    elif kind == "par":
+        parallel_stat.add(ev[2])
+
+# Calculate and display statistics. The report is assembled into one list
+# and flushed with a single write instead of one syscall per print().
+SEP = "=" * 70
+out: list = []
+
+out.append(SEP)
+out.append(" " * 20 + "PHASE 1 METRICS REPORT")
+out.append(SEP)
 
 # LLM Performance
-if metrics["llm_calls"]:
-    avg_llm = sum(metrics["llm_calls"]) / len(metrics["llm_calls"])
-    print(f"\n📊 LLM PERFORMANCE")
-    print(f"   Total calls: {len(metrics['llm_calls'])}")
-    print(f"   Average duration: {avg_llm:.1f}ms ({avg_llm/1000:.1f}s)")
-    print(f"   Min duration: {min(metrics['llm_calls']):.1f}ms")
-    print(f"   Max duration: {max(metrics['llm_calls']):.1f}ms")
+if llm_stat.n:
+    out.append(f"\n📊 LLM PERFORMANCE")
+    out.append(f"   Total calls: {llm_stat.n}")
+    out.append(f"   Average duration: {llm_stat.avg:.1f}ms ({llm_stat.avg/1000:.1f}s)")
+    out.append(f"   Min duration: {llm_stat.mn:.1f}ms")
+    out.append(f"   Max duration: {llm_stat.mx:.1f}ms")
 else:
-    print(f"\n📊 LLM PERFORMANCE")
-    print(f"   No LLM calls found in recent logs")
+    out.append(f"\n📊 LLM PERFORMANCE")
+    out.append(f"   No LLM calls found in recent logs")
 
 # Token Usage
-if metrics["token_usage"]:
-    avg_prompt = sum(t["prompt"] for t in metrics["token_usage"]) / len(metrics["token_usage"])
-    avg_completion = sum(t["completion"] for t in metrics["token_usage"]) / len(metrics["token_usage"])
-    avg_total = sum(t["total"] for t in metrics["token_usage"]) / len(metrics["token_usage"])
-
-    print(f"\n🎯 TOKEN USAGE (NEW!)")
-    print(f"   Total LLM calls with tokens: {len(metrics['token_usage'])}")
-    print(f"   Average prompt tokens: {avg_prompt:.0f}")
-    print(f"   Average completion tokens: {avg_completion:.0f}")
-    print(f"   Average total tokens: {avg_total:.0f}")
-    print(f"   Total tokens consumed: {sum(t['total'] for t in metrics['token_usage'])}")
+if total_stat.n:
+    out.append(f"\n🎯 TOKEN USAGE (NEW!)")
+    out.append(f"   Total LLM calls with tokens: {total_stat.n}")
+    out.append(f"   Average prompt tokens: {prompt_stat.avg:.0f}")
+    out.append(f"   Average completion tokens: {completion_stat.avg:.0f}")
+    out.append(f"   Average total tokens: {total_stat.avg:.0f}")
+    out.append(f"   Total tokens consumed: {total_stat.total}")
 else:
-    print(f"\n🎯 TOKEN USAGE")
-    print(f"   No token usage data found")
-    print(f"   Note: Token counting was just added. Run a query to generate data.")
+    out.append(f"\n🎯 TOKEN USAGE")
+    out.append(f"   No token usage data found")
+    out.append(f"   Note: Token counting was just added. Run a query to generate data.")
 
 # Tool Executions
-if metrics["tool_executions"]:
-    print(f"\n🔧 TOOL EXECUTIONS")
-    for tool_name, outputs in sorted(metrics["tool_executions"].items()):
-        measured_outputs = [o for o in outputs if o is not None]
-        print(f"   {tool_name}:")
-        print(f"      Calls: {len(outputs)}")
-        if measured_outputs:
-            avg_output = sum(measured_outputs) / len(measured_outputs)
-            print(f"      Avg output size: {avg_output:.0f} chars ({avg_output/4:.0f} tokens est.)")
-            print(f"      Min: {min(measured_outputs)} chars, Max: {max(measured_outputs)} chars")
+if tool_stats:
+    out.append(f"\n🔧 TOOL EXECUTIONS")
+    for tool_name, tool_stat in sorted(tool_stats.items()):
+        out.append(f"   {tool_name}:")
+        out.append(f"      Calls: {tool_stat.calls}")
+        if tool_stat.output.n:
+            avg_output = tool_stat.output.avg
+            out.append(f"      Avg output size: {avg_output:.0f} chars ({avg_output/4:.0f} tokens est.)")
+            out.append(f"      Min: {tool_stat.output.mn} chars, Max: {tool_stat.output.mx} chars")
         else:
-            print(f"      Output size not logged (update log formatter to include output_length)")
+            out.append(f"      Output size not logged (update log formatter to include output_length)")
 
         # Highlight web_access token savings
-        if tool_name == "web_access" and measured_outputs:
-            avg_output = sum(measured_outputs) / len(measured_outputs)
-            if avg_output < 3000:
-                print(f"      ✅ Concise mode working! (~80% token savings vs 10K baseline)")
+        if tool_name == "web_access" and tool_stat.output.n:
+            if tool_stat.output.avg < 3000:
+                out.append(f"      ✅ Concise mode working! (~80% token savings vs 10K baseline)")
 else:
-    print(f"\n🔧 TOOL EXECUTIONS")
-    print(f"   No tool executions found in recent logs")
+    out.append(f"\n🔧 TOOL EXECUTIONS")
+    out.append(f"   No tool executions found in recent logs")
 
 # Parallel Execution
-if metrics["parallel_executions"]:
-    total_parallel_tools = sum(metrics["parallel_executions"])
-    avg_batch_size = total_parallel_tools / len(metrics["parallel_executions"])
-    print(f"\n⚡ PARALLEL EXECUTION (NEW!)")
-    print(f"   Parallel batches executed: {len(metrics['parallel_executions'])}")
-    print(f"   Total tools run in parallel: {total_parallel_tools}")
-    print(f"   Average tools per batch: {avg_batch_size:.1f}")
-    print(f"   ✅ Phase 1 parallel execution is working!")
+if parallel_stat.n:
+    out.append(f"\n⚡ PARALLEL EXECUTION (NEW!)")
+    out.append(f"   Parallel batches executed: {parallel_stat.n}")
+    out.append(f"   Total tools run in parallel: {parallel_stat.total}")
+    out.append(f"   Average tools per batch: {parallel_stat.avg:.1f}")
+    out.append(f"   ✅ Phase 1 parallel execution is working!")
 else:
-    print(f"\n⚡ PARALLEL EXECUTION")
-    print(f"   No parallel tool executions detected")
-    print(f"   Note: Parallel execution triggers when 2+ tools are called together")
+    out.append(f"\n⚡ PARALLEL EXECUTION")
+    out.append(f"   No parallel tool executions detected")
+    out.append(f"   Note: Parallel execution triggers when 2+ tools are called together")
 
-print("\n" + "=" * 70)
+out.append(f"\n{SEP}")
 
 # Phase 1 Success Indicators
-print("\n✅ PHASE 1 SUCCESS INDICATORS")
+out.append("\n✅ PHASE 1 SUCCESS INDICATORS")
 success_indicators = []
 
-if metrics["tool_executions"].get("web_access"):
-    web_outputs = [o for o in metrics["tool_executions"]["web_access"] if o is not None]
-    if web_outputs:
-        avg_web_access = sum(web_outputs) / len(web_outputs)
-        if avg_web_access < 3000:
+web_stat = tool_stats.get("web_access")
+if web_stat:
+    if web_stat.output.n:
+        if web_stat.output.avg < 3000:
             success_indicators.append("✓ web_access using concise mode (avg < 3K chars)")
         else:
             success_indicators.append("✗ web_access output still large (check response_format)")
     else:
         success_indicators.append("? web_access calls logged without output sizes (check log formatting)")
 
-if metrics["parallel_executions"]:
-    success_indicators.append(f"✓ Parallel execution working ({len(metrics['parallel_executions'])} batches)")
+if parallel_stat.n:
+    success_indicators.append(f"✓ Parallel execution working ({parallel_stat.n} batches)")
 else:
     success_indicators.append("? No parallel executions yet (run multi-tool query)")
 
-if metrics["token_usage"]:
-    avg_total = sum(t["total"] for t in metrics["token_usage"]) / len(metrics["token_usage"])
-    if avg_total < 3000:
-        success_indicators.append(f"✓ Token usage reasonable (avg {avg_total:.0f} tokens)")
+if total_stat.n:
+    if total_stat.avg < 3000:
+        success_indicators.append(f"✓ Token usage reasonable (avg {total_stat.avg:.0f} tokens)")
     else:
-        success_indicators.append(f"⚠ Token usage high (avg {avg_total:.0f} tokens, target <3K)")
+        success_indicators.append(f"⚠ Token usage high (avg {total_stat.avg:.0f} tokens, target <3K)")
 else:
     success_indicators.append("? Token counting just added (run query to test)")
 
 for indicator in success_indicators:
-    print(f"   {indicator}")
+    out.append(f"   {indicator}")
+
+out.append(f"\n{SEP}")
+out.append("\n💡 TIP: Run 'tail -f ~/.argo_data/logs/argo_brain.log' to watch metrics in real-time")
+out.append("💡 TIP: Check full guide at docs/PHASE1_MEASUREMENT_GUIDE.md")
+out.append("")
 
-print("\n" + "=" * 70)
-print("\n💡 TIP: Run 'tail -f ~/.argo_data/logs/argo_brain.log' to watch metrics in real-time")
-print("💡 TIP: Check full guide at docs/PHASE1_MEASUREMENT_GUIDE.md")
-print()
+sys.stdout.write("\n".join(out) + "\n")
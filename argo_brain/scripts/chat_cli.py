@@ -1,4 +1,9 @@
-"""Interactive CLI for chatting with Argo using layered memory and tools."""
+"""Interactive CLI for chatting with Argo using layered memory and tools.
+
+This is the single chat entry point; variants should wrap chat_loop()
+with different flags rather than copying this module, so fixes and
+optimizations only need to land once.
+"""
 
 from __future__ import annotations
 
@@ -7,18 +12,19 @@ import logging
 import sys
 import textwrap
 import uuid
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List
+from typing import List, TYPE_CHECKING
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from argo_brain.assistant.orchestrator import ArgoAssistant
 from argo_brain.core.memory.session import SessionMode
-from argo_brain.log_setup import setup_logging
-from argo_brain.runtime import create_runtime
-from argo_brain.tools.base import ToolExecutionError, ToolResult
+
+if TYPE_CHECKING:  # pragma: no cover - import only for type checking
+    from argo_brain.assistant.orchestrator import ArgoAssistant
+    from argo_brain.tools.base import ToolResult
 
 COMMANDS = {
     ":help": "Show this help message",
@@ -102,6 +108,8 @@ def _run_tool_command(
         print("Usage: :tool <name> <query_or_url>")
         return
     _, tool_name, tool_query = parts
+    from argo_brain.tools.base import ToolExecutionError
+
     try:
         result = assistant.run_tool(
             tool_name,
@@ -117,31 +125,130 @@ def _run_tool_command(
 
 
 def _render_debug_context(response, debug: bool, show_prompt: bool) -> None:
+    # Assemble the whole block and write it once: each print() is a separate
+    # write() syscall on a line-buffered TTY. List comprehensions (rather
+    # than genexps) feed str.join fastest since join can presize.
     context = response.context
     summary_flag = "yes" if context.session_summary else "no"
-    print(
+    parts = [
         f"[context] summary={summary_flag}, auto_mem={len(context.autobiographical_chunks)}, "
         f"rag={len(context.rag_chunks)}, web_cache={len(context.web_cache_chunks)}, "
         f"short_term={len(context.short_term_messages)}"
-    )
+    ]
     if debug and context.session_summary:
-        print(f"[summary] {context.session_summary}")
+        parts.append(f"[summary] {context.session_summary}")
     if context.autobiographical_chunks:
-        print("[auto] " + " | ".join(chunk.text for chunk in context.autobiographical_chunks))
+        parts.append("[auto] " + " | ".join([c.text for c in context.autobiographical_chunks]))
     if context.rag_chunks:
-        print("[rag] " + " | ".join(chunk.metadata.get("source_type", "unknown") for chunk in context.rag_chunks))
+        parts.append(
+            "[rag] " + " | ".join([c.metadata.get("source_type", "unknown") for c in context.rag_chunks])
+        )
     if context.web_cache_chunks:
-        print(
+        # Walrus capture resolves .metadata once per chunk instead of per .get.
+        parts.append(
             "[web] "
             + " | ".join(
-                f"{chunk.metadata.get('url', 'n/a')} @ {chunk.metadata.get('fetched_at', 'unknown')}"
-                for chunk in context.web_cache_chunks
+                [
+                    f"{(md := c.metadata).get('url', 'n/a')} @ {md.get('fetched_at', 'unknown')}"
+                    for c in context.web_cache_chunks
+                ]
             )
         )
     if context.tool_results:
-        print("[tools] " + " | ".join(result.summary for result in context.tool_results))
+        parts.append("[tools] " + " | ".join([r.summary for r in context.tool_results]))
     if show_prompt and response.prompt_messages:
-        print("\n[prompt]\n" + "\n".join(f"{m.role}: {m.content}" for m in response.prompt_messages))
+        parts.append(
+            "\n[prompt]\n" + "\n".join([f"{m.role}: {m.content}" for m in response.prompt_messages])
+        )
+    sys.stdout.write("\n".join(parts) + "\n")
+
+
+@dataclass
+class _ChatContext:
+    """Mutable state shared between the chat loop and command handlers."""
+
+    assistant: ArgoAssistant
+    logger: logging.Logger
+    mode: SessionMode
+    session_id: str
+    pending_tool_results: List[ToolResult] = field(default_factory=list)
+    user_input: str = ""
+    # Cached once after logging setup: skips building the extra= dict on
+    # every command turn when DEBUG is disabled.
+    debug_enabled: bool = False
+
+
+def _cmd_quit(ctx: _ChatContext) -> str:
+    ctx.logger.info("Session %s exiting chat loop", ctx.session_id)
+    return "break"
+
+
+def _cmd_help(ctx: _ChatContext) -> None:
+    if ctx.debug_enabled:
+        ctx.logger.debug("Help requested", extra={"session_id": ctx.session_id})
+    _print_help()
+
+
+def _cmd_new(ctx: _ChatContext) -> None:
+    ctx.session_id = uuid.uuid4().hex[:8]
+    ctx.pending_tool_results.clear()
+    ctx.logger.info("Starting new session %s", ctx.session_id)
+    print(f"New session: {ctx.session_id}")
+
+
+def _cmd_facts(ctx: _ChatContext) -> None:
+    if ctx.debug_enabled:
+        ctx.logger.debug("Listing profile facts", extra={"session_id": ctx.session_id})
+    print(ctx.assistant.list_profile_facts())
+
+
+def _cmd_summary(ctx: _ChatContext) -> None:
+    if ctx.debug_enabled:
+        ctx.logger.debug("Showing session summary", extra={"session_id": ctx.session_id})
+    summary = ctx.assistant.session_manager.get_session_summary(ctx.session_id)
+    print(summary or "No summary yet.")
+
+
+def _cmd_webcache(ctx: _ChatContext) -> None:
+    if ctx.debug_enabled:
+        ctx.logger.debug("Listing web cache/tool runs", extra={"session_id": ctx.session_id})
+    _print_tool_runs(ctx.assistant, ctx.session_id)
+
+
+def _cmd_stats(ctx: _ChatContext) -> None:
+    if ctx.debug_enabled:
+        ctx.logger.debug("Showing session stats", extra={"session_id": ctx.session_id})
+    _print_session_stats(ctx.assistant, ctx.session_id)
+
+
+def _cmd_tools(ctx: _ChatContext) -> None:
+    if ctx.debug_enabled:
+        ctx.logger.debug("Listing tools", extra={"session_id": ctx.session_id})
+    _print_tools(ctx.assistant)
+
+
+def _cmd_tool(ctx: _ChatContext) -> None:
+    if ctx.debug_enabled:
+        ctx.logger.debug("Running tool command", extra={"session_id": ctx.session_id})
+    _run_tool_command(
+        ctx.assistant, ctx.session_id, ctx.user_input, ctx.pending_tool_results, ctx.mode
+    )
+
+
+# One dict lookup replaces the per-turn if-elif chain; commands with
+# arguments (:tool) dispatch on their first word.
+HANDLERS = {
+    ":help": _cmd_help,
+    ":quit": _cmd_quit,
+    ":q": _cmd_quit,
+    ":new": _cmd_new,
+    ":facts": _cmd_facts,
+    ":summary": _cmd_summary,
+    ":webcache": _cmd_webcache,
+    ":stats": _cmd_stats,
+    ":tools": _cmd_tools,
+    ":tool": _cmd_tool,
+}
 
 
 def _render_answer(response, debug: bool) -> None:
@@ -156,6 +263,13 @@ def chat_loop(
     debug: bool = False,
     show_prompt: bool = False,
 ) -> None:
+    # Deferred imports: the orchestrator transitively loads the LLM client,
+    # memory manager, and embeddings, so --help and argparse errors in
+    # main() should not pay that cold start.
+    from argo_brain.assistant.orchestrator import ArgoAssistant
+    from argo_brain.log_setup import setup_logging
+    from argo_brain.runtime import create_runtime
+
     setup_logging()
     logger = logging.getLogger("argo_brain.cli")
     runtime = create_runtime()
@@ -167,80 +281,66 @@ def chat_loop(
         default_session_mode=mode,
         ingestion_manager=runtime.ingestion_manager,
     )
-    session_id = initial_session
-    pending_tool_results: List[ToolResult] = []
+    ctx = _ChatContext(
+        assistant=assistant,
+        logger=logger,
+        mode=mode,
+        session_id=initial_session,
+        debug_enabled=logger.isEnabledFor(logging.DEBUG),
+    )
     print("Starting Argo chat. Type :help for commands.")
+    try:
+        # Line editing plus recall across the session; bound the history so
+        # a long-running REPL doesn't grow without limit.
+        import readline
+
+        readline.set_history_length(500)
+    except ImportError:
+        pass
     while True:
         try:
-            user_input = input("You> ").strip()
+            raw = input("You> ")
         except EOFError:
             print()
             break
+        # .strip() copies the whole line; a multi-megabyte paste is usually
+        # already trimmed, so only pay for the copy when an edge needs it.
+        if raw and (raw[0].isspace() or raw[-1].isspace()):
+            user_input = raw.strip()
+        else:
+            user_input = raw
         if not user_input:
             continue
         if user_input.startswith(":"):
-            cmd = user_input.lower()
-            if cmd in (":quit", ":q"):
-                logger.info("Session %s exiting chat loop", session_id)
-                break
-            if cmd == ":help":
-                logger.debug("Help requested", extra={"session_id": session_id})
-                _print_help()
-                continue
-            if cmd == ":new":
-                session_id = uuid.uuid4().hex[:8]
-                pending_tool_results.clear()
-                logger.info("Starting new session %s", session_id)
-                print(f"New session: {session_id}")
-                continue
-            if cmd == ":facts":
-                logger.debug("Listing profile facts", extra={"session_id": session_id})
-                print(assistant.list_profile_facts())
-                continue
-            if cmd == ":summary":
-                logger.debug("Showing session summary", extra={"session_id": session_id})
-                summary = assistant.session_manager.get_session_summary(session_id)
-                print(summary or "No summary yet.")
+            ctx.user_input = user_input
+            handler = HANDLERS.get(user_input.lower().split(None, 1)[0])
+            if handler is None:
+                print(f"Unknown command: {user_input}")
                 continue
-            if cmd == ":webcache":
-                logger.debug("Listing web cache/tool runs", extra={"session_id": session_id})
-                _print_tool_runs(assistant, session_id)
-                continue
-            if cmd == ":stats":
-                logger.debug("Showing session stats", extra={"session_id": session_id})
-                _print_session_stats(assistant, session_id)
-                continue
-            if cmd == ":tools":
-                logger.debug("Listing tools", extra={"session_id": session_id})
-                _print_tools(assistant)
-                continue
-            if cmd.startswith(":tool"):
-                logger.debug("Running tool command", extra={"session_id": session_id})
-                _run_tool_command(assistant, session_id, user_input, pending_tool_results, mode)
-                continue
-            print(f"Unknown command: {user_input}")
+            if handler(ctx) == "break":
+                break
             continue
         logger.info(
             "Processing user message",
-            extra={"session_id": session_id, "chars": len(user_input)},
+            extra={"session_id": ctx.session_id, "chars": len(user_input)},
         )
         try:
             response = assistant.send_message(
-                session_id,
+                ctx.session_id,
                 user_input,
-                tool_results=pending_tool_results or None,
+                tool_results=ctx.pending_tool_results or None,
                 return_prompt=show_prompt or debug,
                 session_mode=mode,
             )
         except RuntimeError as exc:
-            pending_tool_results = []
-            logger.error("Assistant error", exc_info=True, extra={"session_id": session_id})
+            ctx.pending_tool_results = []
+            logger.error("Assistant error", exc_info=True, extra={"session_id": ctx.session_id})
             print(f"Error: {exc}")
             continue
-        pending_tool_results = []
+        ctx.pending_tool_results = []
         logger.info(
             "Assistant replied",
-            extra={"session_id": session_id, "chars": len(response.text)},
+            extra={"session_id": ctx.session_id, "chars": len(response.text)},
         )
         _render_answer(response, debug)
         _render_debug_context(response, debug=debug, show_prompt=show_prompt)
@@ -31,11 +31,19 @@ def main(argv: list[str] | None = None) -> None:
     ssl_certfile = args.ssl_certfile or os.getenv("ARGO_WEB_TLS_CERT")
     ssl_keyfile = args.ssl_keyfile or os.getenv("ARGO_WEB_TLS_KEY")
 
+    # workers and reload are mutually exclusive in uvicorn; reload is dev-only.
+    workers = None if args.reload else int(os.getenv("ARGO_WEB_WORKERS", "1"))
+
     uvicorn.run(
         "argo_brain.web.app:app",
         host=host,
         port=port,
         reload=args.reload,
+        workers=workers,
+        # uvloop + httptools (both ship with uvicorn[standard]) cut
+        # per-event loop and HTTP parsing overhead versus stdlib asyncio.
+        loop="uvloop",
+        http="httptools",
         ssl_certfile=ssl_certfile,
         ssl_keyfile=ssl_keyfile,
     )
@@ -23,6 +23,35 @@ from argo_brain.config import CONFIG
 from argo_brain.vector_store import get_vector_store
 
 
+# Ids deleted per statement; bounds how long each write transaction runs.
+DELETE_BATCH_SIZE = 1000
+
+
+def delete_expired_in_batches(vector_store, namespace, cutoff_timestamp):
+    """Delete rows older than the cutoff in bounded id batches.
+
+    A single filter delete can expand into one huge statement that holds
+    the writer lock for the whole cleanup, blocking readers. Paging the
+    matching ids and deleting DELETE_BATCH_SIZE at a time keeps each write
+    transaction short, at the cost of a SELECT per page.
+    """
+
+    filters = {"fetched_at": {"$lt": cutoff_timestamp}}
+    total = 0
+    while True:
+        # Always page from offset 0: each delete shifts what remains.
+        ids = vector_store.query_ids(namespace, filters=filters, limit=DELETE_BATCH_SIZE)
+        if not ids:
+            break
+        vector_store.delete(namespace=namespace, ids=ids)
+        total += len(ids)
+        print(f"  ... deleted batch of {len(ids)} (total: {total})")
+    if total == 0:
+        # Backends without query_ids support fall back to the filter delete.
+        return vector_store.delete(namespace=namespace, filters=filters)
+    return total
+
+
 def cleanup_web_cache():
     """Delete web_cache entries older than TTL."""
 
@@ -42,8 +71,8 @@ def cleanup_web_cache():
 
     try:
         # Delete chunks with fetched_at < cutoff
-        deleted_count = vector_store.delete(
-            namespace=CONFIG.collections.web_cache, filters={"fetched_at": {"$lt": cutoff_timestamp}}
+        deleted_count = delete_expired_in_batches(
+            vector_store, CONFIG.collections.web_cache, cutoff_timestamp
         )
 
         print(f"✓ Deleted {deleted_count} expired web cache entries")
@@ -77,9 +106,7 @@ def cleanup_all_namespaces():
         vector_store = get_vector_store()
 
         try:
-            deleted_count = vector_store.delete(
-                namespace=namespace, filters={"fetched_at": {"$lt": cutoff_timestamp}}
-            )
+            deleted_count = delete_expired_in_batches(vector_store, namespace, cutoff_timestamp)
             print(f"  ✓ Deleted {deleted_count} entries")
             total_deleted += deleted_count
         except Exception as e:
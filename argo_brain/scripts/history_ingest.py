@@ -2,29 +2,82 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
-import shutil
 import sqlite3
 import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
+from urllib.parse import urlsplit
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 from argo_brain.config import CONFIG
-from argo_brain.rag import ingest_url
-from youtube_ingest import ingest_youtube_url
+from argo_brain.rag import (
+    IngestItem,
+    fetch_article_text,
+    ingest_text,
+    ingest_text_batch,
+    ingest_url,
+)
+from youtube_ingest import (
+    extract_video_id,
+    fetch_transcript_text,
+    ingest_youtube_transcript,
+    ingest_youtube_url,
+)
+
+try:
+    # orjson reads/writes the state file as bytes, skipping the str
+    # encode/decode round trip; fall back silently if not installed.
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps_indented(obj: dict) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps_indented(obj: dict) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
 
 PROJECT_DIR = CONFIG.paths.project_root
 CONFIG_DIR = PROJECT_DIR / "config"
 DATA_RAW_DIR = CONFIG.paths.data_raw_path
 STATE_PATH = DATA_RAW_DIR / "history_state.json"
 HISTORY_COPY_PATH = DATA_RAW_DIR / "chrome_history_copy"
+SEEN_DB_PATH = DATA_RAW_DIR / "ingested_urls.sqlite3"
 WINDOWS_USERNAME_FILE = CONFIG_DIR / "windows_username.txt"
 
+# Bounded fan-out for network fetches; embedding stays single-threaded.
+MAX_FETCH_WORKERS = 8
+
+# Backpressure on the submit loop: never more than this many fetches in
+# flight, so completed article texts drain into the embedder instead of
+# accumulating in memory when the fetchers outrun it on a large first run.
+MAX_IN_FLIGHT = MAX_FETCH_WORKERS * 2
+
+# Documents accumulated per batched embed/upsert flush.
+FLUSH_EVERY = 16
+
+# URLs ingested more recently than this are skipped without even fetching;
+# older revisits are re-fetched but only re-embedded if the content changed.
+REINGEST_TTL_SECONDS = 7 * 86400
+
+# Pragmas safe on read-only (including immutable) connections.
+_READ_PRAGMAS = (
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA query_only=1",
+)
+
 
 def get_windows_username() -> str:
     """
@@ -45,26 +98,92 @@ def get_windows_username() -> str:
     )
 
 
-def copy_history_db(username: str) -> Path:
-    """Copy the locked Chrome History database into the data_raw directory."""
+def _history_source_path(username: str) -> Path:
+    """Return the path of Chrome's live History database."""
 
-    source = (
+    return (
         Path("/mnt/c/Users")
         / username
         / "AppData/Local/Google/Chrome/User Data/Default/History"
     )
+
+
+def copy_history_db(username: str) -> Path:
+    """Snapshot the locked Chrome History database into the data_raw directory.
+
+    Uses SQLite's backup API rather than a byte copy: it takes a consistent
+    page-level snapshot even while Chrome holds the database open, whereas
+    copying the raw file can capture a torn state mid-transaction.
+    """
+
+    source = _history_source_path(username)
     if not source.exists():
         raise FileNotFoundError(f"Chrome history file not found at {source}")
     DATA_RAW_DIR.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(source, HISTORY_COPY_PATH)
+    src = sqlite3.connect(source)
+    dst = sqlite3.connect(HISTORY_COPY_PATH)
+    try:
+        src.backup(dst)
+    finally:
+        dst.close()
+        src.close()
     return HISTORY_COPY_PATH
 
 
+def open_history_connection(username: str) -> sqlite3.Connection:
+    """Open Chrome's History database for reading without copying it.
+
+    The steady-state path opens the live file with mode=ro&immutable=1,
+    skipping the O(file size) copy across the drvfs boundary entirely. If
+    Chrome's lock makes that open unreadable, fall back to a backup-API
+    snapshot and read the copy.
+    """
+
+    source = _history_source_path(username)
+    if not source.exists():
+        raise FileNotFoundError(f"Chrome history file not found at {source}")
+    try:
+        conn = sqlite3.connect(f"file:{source}?mode=ro&nolock=1&immutable=1", uri=True)
+        conn.execute("SELECT 1 FROM urls LIMIT 1")
+    except sqlite3.Error:
+        return _open_history_db(copy_history_db(username))
+    for pragma in _READ_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def _open_history_db(path: Path) -> sqlite3.Connection:
+    """Open the copied history database tuned for a single large read scan.
+
+    WAL + synchronous=NORMAL drop journal/fsync overhead, a 64 MiB page
+    cache plus a 256 MiB mmap window turn the ordered range scan into
+    mostly sequential mapped reads, and query_only guards against
+    accidental writes to the copy.
+    """
+
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    for pragma in _READ_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def _close_history_db(conn: sqlite3.Connection) -> None:
+    """Close the connection, letting SQLite refresh planner statistics."""
+
+    try:
+        conn.execute("PRAGMA optimize")
+    except sqlite3.OperationalError:
+        pass  # query_only connections may refuse the stats write; harmless.
+    conn.close()
+
+
 def load_last_visit_time() -> int:
     """Return the last processed Chrome timestamp."""
 
     if STATE_PATH.exists():
-        data = json.loads(STATE_PATH.read_text(encoding="utf-8"))
+        data = _loads(STATE_PATH.read_bytes())
         return int(data.get("last_visit_time", 0))
     return 0
 
@@ -72,40 +191,64 @@ def load_last_visit_time() -> int:
 def save_last_visit_time(timestamp: int) -> None:
     """Persist the last processed Chrome timestamp."""
 
-    STATE_PATH.write_text(
-        json.dumps({"last_visit_time": timestamp}, indent=2),
-        encoding="utf-8",
-    )
+    STATE_PATH.write_bytes(_dumps_indented({"last_visit_time": timestamp}))
 
 
-def fetch_new_history(conn: sqlite3.Connection, since: int) -> List[Tuple[str, str, int]]:
+def fetch_new_history(
+    conn: sqlite3.Connection, since: int
+) -> Iterator[Tuple[str, str, int, int]]:
     """
-    Fetch browser history entries newer than the provided timestamp.
+    Stream browser history entries newer than the provided timestamp.
+
+    Rows are yielded straight from the cursor so a first-run ingestion over
+    hundreds of thousands of entries never materializes them as one list.
+    The YouTube check runs in SQL (LIKE is case-insensitive for ASCII) so
+    the dispatch in run_ingestion needs no per-row string scan in Python.
 
     Args:
         conn: sqlite3 connection to the copied Chrome database.
         since: Chrome timestamp (microseconds since 1601) representing the last processed row.
 
-    Returns:
-        List of tuples shaped as (url, title, last_visit_time).
+    Yields:
+        Tuples shaped as (url, title, last_visit_time, is_youtube).
     """
 
     query = """
-        SELECT url, title, last_visit_time
+        SELECT url, title, last_visit_time,
+               (url LIKE '%youtube.com%' OR url LIKE '%youtu.be%') AS is_yt
         FROM urls
         WHERE last_visit_time > ?
           AND url LIKE 'http%'
         ORDER BY last_visit_time ASC
     """
-    cursor = conn.execute(query, (since,))
-    return [(row[0], row[1], row[2]) for row in cursor.fetchall()]
+    yield from conn.execute(query, (since,))
+
+
+def max_visit_time(conn: sqlite3.Connection, since: int) -> int:
+    """Return the newest matching timestamp, or since when nothing is newer.
+
+    O(1) on the last_visit_time index; replaces a per-row max() in the
+    ingestion loop and stays correct even if row iteration stops early.
+    """
+
+    row = conn.execute(
+        "SELECT MAX(last_visit_time) FROM urls WHERE last_visit_time > ? AND url LIKE 'http%'",
+        (since,),
+    ).fetchone()
+    return row[0] if row and row[0] is not None else since
 
 
 def is_youtube_url(url: str) -> bool:
-    """Return True when the URL appears to reference YouTube."""
+    """Return True when the URL's host is a YouTube domain.
+
+    Only the host is examined: urlsplit is C-implemented and the netloc is
+    short, so lowercasing it is far cheaper than url.lower() on a long URL
+    (hosts are case-insensitive; paths are not, and a path mentioning
+    youtube.com should not count anyway).
+    """
 
-    lowered = url.lower()
-    return "youtube.com" in lowered or "youtu.be" in lowered
+    host = urlsplit(url).netloc.lower()
+    return host.endswith(("youtube.com", "youtu.be"))
 
 
 def process_url(url: str) -> None:
@@ -122,31 +265,212 @@ def process_url(url: str) -> None:
         ingest_url(url)
 
 
+def _download(url: str, is_yt: int) -> Tuple[str, str, str]:
+    """Fetch a document's text (network-bound; safe to run on worker threads).
+
+    Returns:
+        (kind, video_id, text) where kind is "youtube" or "web" and
+        video_id is empty for web pages.
+    """
+
+    if is_yt:
+        video_id = extract_video_id(url)
+        if not video_id:
+            raise ValueError(f"Could not find a video ID in URL: {url}")
+        return ("youtube", video_id, fetch_transcript_text(video_id))
+    return ("web", "", fetch_article_text(url))
+
+
+def _persist(url: str, kind: str, video_id: str, text: str) -> None:
+    """Embed and store a downloaded document (single-threaded)."""
+
+    if kind == "youtube":
+        ingest_youtube_transcript(url, video_id, text)
+    else:
+        ingest_text(text=text, source_id=url, source_type="web_page", url=url)
+
+
+def _open_seen_db() -> sqlite3.Connection:
+    """Open (creating if needed) the sidecar tracking already-ingested URLs.
+
+    Chrome histories revisit the same URLs constantly; this table lets the
+    loop skip the fetch entirely for recent URLs and skip the embedding -
+    the expensive step - whenever the content digest is unchanged.
+    """
+
+    DATA_RAW_DIR.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(SEEN_DB_PATH)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS ingested (url TEXT PRIMARY KEY, digest BLOB, ts INTEGER)"
+    )
+    return conn
+
+
+def _content_digest(text: str) -> bytes:
+    """Digest of extracted content; blake2b is faster than sha256 for this."""
+
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+def _to_ingest_item(url: str, kind: str, video_id: str, text: str) -> IngestItem:
+    """Wrap a downloaded document as a pending batch-ingest item."""
+
+    if kind == "youtube":
+        return IngestItem(
+            text=text,
+            source_id=f"youtube:{video_id}",
+            source_type="youtube_transcript",
+            url=url,
+            extra_meta={"video_id": video_id, "fetched_ts": int(time.time())},
+        )
+    return IngestItem(text=text, source_id=url, source_type="web_page", url=url)
+
+
+def _flush(
+    pending: List[IngestItem],
+    marks: List[Tuple[str, bytes]],
+    seen: sqlite3.Connection,
+) -> None:
+    """Embed and upsert the accumulated batch, then record it as ingested."""
+
+    if not pending:
+        return
+    try:
+        ingest_text_batch(pending)
+    except Exception as exc:  # noqa: BLE001 - want to continue processing
+        print(f"Failed to ingest batch of {len(pending)}: {exc}")
+    else:
+        if marks:
+            ts = int(time.time())
+            with seen:
+                seen.executemany(
+                    "INSERT OR REPLACE INTO ingested (url, digest, ts) VALUES (?, ?, ?)",
+                    [(url, digest, ts) for url, digest in marks],
+                )
+    pending.clear()
+    marks.clear()
+
+
 def run_ingestion() -> None:
-    """Run the incremental Chrome history ingestion loop."""
+    """Run the incremental Chrome history ingestion loop.
+
+    Fetching is I/O-bound and embedding is CPU/GPU-bound, so downloads run
+    on a bounded thread pool while embed/persist stays on the main thread.
+    Downloaded documents accumulate into batches of FLUSH_EVERY so the
+    embedder and vector store see one large call instead of one per URL.
+    """
 
     username = get_windows_username()
-    history_path = copy_history_db(username)
     last_timestamp = load_last_visit_time()
 
-    with sqlite3.connect(history_path) as conn:
-        rows = fetch_new_history(conn, last_timestamp)
+    rows = 0
+    processed = 0
+    skipped = 0
+    pending: List[IngestItem] = []
+    marks: List[Tuple[str, bytes]] = []
+    refreshed: List[str] = []
+    conn = open_history_connection(username)
+    seen = _open_seen_db()
+    now = int(time.time())
+    seen_cache = {
+        url: (digest, ts)
+        for url, digest, ts in seen.execute("SELECT url, digest, ts FROM ingested")
+    }
+    try:
+        latest_seen = max_visit_time(conn, last_timestamp)
+        with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as pool:
+            in_flight = {}
+            handled = set()
+
+            def consume(done) -> None:
+                nonlocal processed, skipped
+                for future in done:
+                    url, title, _visit = in_flight.pop(future)
+                    try:
+                        kind, video_id, text = future.result()
+                    except Exception as exc:  # noqa: BLE001 - want to continue processing
+                        print(f"Failed to ingest {url}: {exc}")
+                        continue
+                    digest = _content_digest(text)
+                    entry = seen_cache.get(url)
+                    if entry and entry[0] == digest:
+                        # Same content as last time: refresh the timestamp only.
+                        skipped += 1
+                        refreshed.append(url)
+                        continue
+                    print(f"Ingesting {url} (title: {title})")
+                    processed += 1
+                    pending.append(_to_ingest_item(url, kind, video_id, text))
+                    marks.append((url, digest))
+                    if len(pending) >= FLUSH_EVERY:
+                        _flush(pending, marks, seen)
+
+            def scan() -> int:
+                """Submit fetches for one pass over the history rows.
+
+                Returns the matching row count. Safe to re-run after an
+                aborted pass: URLs already handled (skipped or submitted)
+                are passed over without double-counting.
+                """
+                nonlocal skipped
+                count = 0
+                for url, title, last_visit_time, is_yt in fetch_new_history(conn, last_timestamp):
+                    count += 1
+                    if url in handled:
+                        continue
+                    handled.add(url)
+                    entry = seen_cache.get(url)
+                    if entry and now - entry[1] < REINGEST_TTL_SECONDS:
+                        # Recently ingested: skip the fetch entirely.
+                        skipped += 1
+                        continue
+                    in_flight[pool.submit(_download, url, is_yt)] = (url, title, last_visit_time)
+                    if len(in_flight) >= MAX_IN_FLIGHT:
+                        # Drain at least one completion before submitting
+                        # more, bounding how many fetched texts sit in
+                        # memory at once.
+                        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                        consume(done)
+                return count
+
+            try:
+                rows = scan()
+            except sqlite3.DatabaseError:
+                # The zero-copy nolock/immutable open reads Chrome's live
+                # file, and a write landing mid-scan can surface as
+                # SQLITE_CORRUPT (or abort the cursor) per SQLite's docs.
+                # Fall back to a consistent backup-API snapshot and rescan;
+                # handled URLs are not resubmitted.
+                print("Live history read failed mid-scan; retrying from a snapshot copy.")
+                _close_history_db(conn)
+                conn = _open_history_db(copy_history_db(username))
+                latest_seen = max_visit_time(conn, last_timestamp)
+                rows = scan()
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                consume(done)
+            _flush(pending, marks, seen)
+        if refreshed:
+            with seen:
+                seen.executemany(
+                    "UPDATE ingested SET ts=? WHERE url=?",
+                    [(now, url) for url in refreshed],
+                )
+    finally:
+        seen.close()
+        _close_history_db(conn)
 
     if not rows:
         print("No new history entries found.")
         return
 
-    latest_seen = last_timestamp
-    for url, title, last_visit_time in rows:
-        latest_seen = max(latest_seen, last_visit_time)
-        print(f"Ingesting {url} (title: {title})")
-        try:
-            process_url(url)
-        except Exception as exc:  # noqa: BLE001 - want to continue processing
-            print(f"Failed to ingest {url}: {exc}")
-
     save_last_visit_time(latest_seen)
-    print(f"Processed {len(rows)} entries. Updated last_visit_time to {latest_seen}.")
+    print(
+        f"Processed {processed} of {rows} new entries ({skipped} skipped as "
+        f"already ingested). Updated last_visit_time to {latest_seen}."
+    )
 
 
 def _main(argv: List[str]) -> None:
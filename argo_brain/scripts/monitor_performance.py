@@ -7,8 +7,66 @@ This script tails the log file and shows timing information in real-time.
 import re
 import sys
 import time
+from datetime import datetime
 from pathlib import Path
 
+try:
+    # Event-driven tail: the kernel wakes us when the log is written
+    # instead of polling every 100 ms. Fall back to polling if missing.
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:
+    INotify = None
+
+# Compiled once: the tail loop runs these against every log line, and
+# re.match/re.search with a string pattern re-hits the regex cache per call.
+# Format: 2025-12-01T15:29:31 [INFO] argo_brain.llm_client - LLM request completed
+_LINE_RE = re.compile(
+    r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}) \[(\w+)\] ([\w.]+) - (.+)'
+)
+# Fused alternation: one scan over the message collects every metric field
+# instead of a separate re.search per field.
+_META_RE = re.compile(
+    r'elapsed_ms=(?P<elapsed>[\d.]+)|tokens_max=(?P<tokens>\d+)|tool=(?P<tool>[\w_]+)'
+)
+
+
+def _follow(f, log_path: Path):
+    """Yield lines appended to the log file as they arrive.
+
+    With inotify_simple installed this blocks on kernel modify events
+    (draining readline to EOF after each wakeup) and reopens the file when
+    rotation recreates it in the parent directory. Without it, fall back
+    to the 100 ms readline poll.
+    """
+
+    if INotify is None:
+        while True:
+            line = f.readline()
+            if not line:
+                time.sleep(0.1)
+                continue
+            yield line
+
+    inotify = INotify()
+    inotify.add_watch(log_path, inotify_flags.MODIFY)
+    watch_dir = inotify.add_watch(
+        log_path.parent, inotify_flags.CREATE | inotify_flags.MOVED_TO
+    )
+    try:
+        while True:
+            line = f.readline()
+            if line:
+                yield line
+                continue
+            for event in inotify.read(timeout=1000):
+                if event.wd == watch_dir and event.name == log_path.name:
+                    # Log rotation: reopen the fresh file and watch it.
+                    f.close()
+                    f = log_path.open('r')
+                    inotify.add_watch(log_path, inotify_flags.MODIFY)
+    finally:
+        inotify.close()
+
 
 def tail_logs(log_path: Path):
     """Tail the log file and show performance metrics."""
@@ -20,8 +78,9 @@ def tail_logs(log_path: Path):
     print("=" * 80)
     print()
 
-    # Track timing between events
-    last_timestamp = None
+    # Track timing between events (parsed datetime cached so each line is
+    # only parsed once, not reparsed as "previous" on the next iteration).
+    last_parsed = None
     last_event = None
 
     try:
@@ -29,37 +88,27 @@ def tail_logs(log_path: Path):
             # Go to end of file
             f.seek(0, 2)
 
-            while True:
-                line = f.readline()
-                if not line:
-                    time.sleep(0.1)
-                    continue
-
+            for line in _follow(f, log_path):
                 # Parse log line
-                # Format: 2025-12-01T15:29:31 [INFO] argo_brain.llm_client - LLM request completed
-                match = re.match(
-                    r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}) \[(\w+)\] ([\w.]+) - (.+)',
-                    line
-                )
+                match = _LINE_RE.match(line)
 
                 if not match:
                     continue
 
                 timestamp, level, logger, message = match.groups()
 
-                # Extract elapsed_ms if present
-                elapsed_match = re.search(r'elapsed_ms=([\d.]+)', message)
-                tokens_match = re.search(r'tokens_max=(\d+)', message)
+                # Collect metric fields (elapsed_ms, tokens_max, tool) in one pass
+                meta = {}
+                for field in _META_RE.finditer(message):
+                    meta[field.lastgroup] = field.group(field.lastgroup)
 
                 # Calculate time since last event
-                if last_timestamp:
-                    try:
-                        from datetime import datetime
-                        current = datetime.fromisoformat(timestamp)
-                        previous = datetime.fromisoformat(last_timestamp)
-                        delta = (current - previous).total_seconds()
-                    except:
-                        delta = 0
+                try:
+                    current = datetime.fromisoformat(timestamp)
+                except ValueError:
+                    current = None
+                if current and last_parsed:
+                    delta = (current - last_parsed).total_seconds()
                 else:
                     delta = 0
 
@@ -69,15 +118,14 @@ def tail_logs(log_path: Path):
 
                 if "LLM request completed" in message:
                     color = "\033[92m"  # Green
-                    if elapsed_match:
-                        elapsed = float(elapsed_match.group(1))
+                    if "elapsed" in meta:
+                        elapsed = float(meta["elapsed"])
                         print(f"{color}[{timestamp}] LLM completed in {elapsed/1000:.2f}s (since last: {delta:.1f}s){reset}")
                         if elapsed > 60000:  # More than 60 seconds
                             print(f"  ⚠️  WARNING: Very slow LLM response!")
                 elif "Executing tool" in message:
                     color = "\033[94m"  # Blue
-                    tool_match = re.search(r'tool=([\w_]+)', message)
-                    tool_name = tool_match.group(1) if tool_match else "unknown"
+                    tool_name = meta.get("tool", "unknown")
                     print(f"{color}[{timestamp}] Executing tool: {tool_name} (since last: {delta:.1f}s){reset}")
                 elif "Web search completed" in message or "WebAccessTool fetched" in message:
                     color = "\033[93m"  # Yellow
@@ -91,7 +139,8 @@ def tail_logs(log_path: Path):
                     color = "\033[96m"  # Cyan
                     print(f"{color}[{timestamp}] RESPONSE COMPLETE (total time: {delta:.1f}s){reset}\n")
 
-                last_timestamp = timestamp
+                if current:
+                    last_parsed = current
                 last_event = message
 
     except KeyboardInterrupt:
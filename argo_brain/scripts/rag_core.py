@@ -15,8 +15,9 @@ from argo_brain.rag import answer_question, ingest_url
 
 
 def _looks_like_url(text: str) -> bool:
-    lowered = text.lower()
-    return lowered.startswith("http://") or lowered.startswith("https://")
+    # Only the scheme matters; lowercase just the first 8 chars instead of
+    # copying the whole string.
+    return text[:8].lower().startswith(("http://", "https://"))
 
 
 def _main(argv: List[str]) -> None:
@@ -72,18 +72,19 @@ def fetch_transcript_text(video_id: str) -> str:
     return "\n".join(segment["text"].strip() for segment in segments if segment["text"])
 
 
-def ingest_youtube_url(url: str) -> None:
+def ingest_youtube_transcript(url: str, video_id: str, transcript: str) -> None:
     """
-    Fetch and ingest the transcript associated with a YouTube URL.
+    Ingest an already-fetched transcript for a YouTube video.
+
+    Split from ingest_youtube_url so the network fetch can run on worker
+    threads while persistence stays single-threaded.
 
     Args:
         url: Full YouTube watch/share URL.
+        video_id: 11-character video ID extracted from the URL.
+        transcript: Plain-text transcript to store.
     """
 
-    video_id = extract_video_id(url)
-    if not video_id:
-        raise ValueError(f"Could not find a video ID in URL: {url}")
-    transcript = fetch_transcript_text(video_id)
     doc = SourceDocument(
         id=f"youtube:{video_id}",
         source_type="youtube_transcript",
@@ -102,6 +103,20 @@ def ingest_youtube_url(url: str) -> None:
     )
 
 
+def ingest_youtube_url(url: str) -> None:
+    """
+    Fetch and ingest the transcript associated with a YouTube URL.
+
+    Args:
+        url: Full YouTube watch/share URL.
+    """
+
+    video_id = extract_video_id(url)
+    if not video_id:
+        raise ValueError(f"Could not find a video ID in URL: {url}")
+    ingest_youtube_transcript(url, video_id, fetch_transcript_text(video_id))
+
+
 def _main(argv: List[str]) -> None:
     """CLI entry point for ingesting a single YouTube URL."""
 
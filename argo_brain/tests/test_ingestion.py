@@ -92,6 +92,26 @@ class IngestionManagerTests(unittest.TestCase):
         # Should only write to one namespace (no longer writes summary separately)
         self.assertEqual(len(set(namespaces)), 1)
 
+    def test_batch_ingestion_writes_once_per_namespace(self) -> None:
+        """Test that ingest_documents issues a single add for same-namespace docs."""
+        docs = [
+            SourceDocument(
+                id=f"doc:{idx}",
+                source_type="web_article",
+                raw_text="Data science " * 100,
+                cleaned_text="Data science " * 100,
+                url=f"https://example.com/{idx}",
+                metadata={},
+            )
+            for idx in range(3)
+        ]
+        self.manager.ingest_documents(docs)
+        self.assertEqual(len(self.store.add_calls), 1)
+        call = self.store.add_calls[0]
+        self.assertEqual(call["namespace"], CONFIG.collections.web_articles)
+        source_ids = {meta["source_id"] for meta in call["metadatas"]}
+        self.assertEqual(source_ids, {"doc:0", "doc:1", "doc:2"})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -13,6 +13,7 @@ from argo_brain.core.memory.document import SourceDocument
 from argo_brain.core.memory.ingestion import IngestionManager
 from argo_brain.core.vector_store.base import Document, VectorStore
 from argo_brain.core.vector_store import factory as factory_module
+from argo_brain import vector_store as vector_store_module
 from argo_brain.security import TrustLevel
 
 
@@ -65,8 +66,10 @@ class FakeVectorStore(VectorStore):
 class RagIntegrationTests(unittest.TestCase):
     def setUp(self) -> None:
         self.fake_store = FakeVectorStore()
-        self.original_factory_store = factory_module._VECTOR_STORE
-        factory_module._VECTOR_STORE = self.fake_store
+        self.original_build = factory_module._build_vector_store
+        factory_module._build_vector_store = lambda config: self.fake_store
+        factory_module._default_vector_store.cache_clear()
+        vector_store_module.get_vector_store.cache_clear()
         self.rag_module = importlib.reload(importlib.import_module("argo_brain.rag"))
         self.ingestion_manager = IngestionManager(
             vector_store=self.fake_store,
@@ -80,7 +83,9 @@ class RagIntegrationTests(unittest.TestCase):
     def tearDown(self) -> None:
         self.rag_module._VECTOR_STORE = self.original_store
         self.rag_module.embed_single = self.original_embed_single
-        factory_module._VECTOR_STORE = self.original_factory_store
+        factory_module._build_vector_store = self.original_build
+        factory_module._default_vector_store.cache_clear()
+        vector_store_module.get_vector_store.cache_clear()
 
     def test_ingest_and_retrieve_same_namespace(self) -> None:
         unique_phrase = "orion-scout-probe"
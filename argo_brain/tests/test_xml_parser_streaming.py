@@ -0,0 +1,68 @@
+"""Tests for streaming XML tool-call parsing."""
+
+from __future__ import annotations
+
+from argo_brain.tools.xml_parser import StreamingXMLToolParser, XMLToolParser
+
+SAMPLE = (
+    "Let me look that up.\n"
+    "<tool_call>\n"
+    "<function=web_search>\n"
+    "<parameter=query>\n"
+    "argo brain\n"
+    "</parameter>\n"
+    "</function>\n"
+    "</tool_call>\n"
+    "And also:\n"
+    "<tool_call>\n"
+    "<function=web_access>\n"
+    "<parameter=url>\n"
+    "https://example.com\n"
+    "</parameter>\n"
+    "</function>\n"
+    "</tool_call>\n"
+)
+
+
+def test_iter_tool_calls_matches_batch_extraction():
+    parser = XMLToolParser()
+    expected = parser.extract_tool_calls(SAMPLE)
+    assert len(expected) == 2
+
+    for chunk_size in (1, 5, 17, 4096):
+        chunks = [SAMPLE[i : i + chunk_size] for i in range(0, len(SAMPLE), chunk_size)]
+        assert list(parser.iter_tool_calls(chunks)) == expected
+
+
+def test_iter_tool_calls_flushes_unterminated_final_call():
+    parser = XMLToolParser()
+    truncated = SAMPLE + "<tool_call>\n<function=f>\n<parameter=a>\n1\n</parameter>\n"
+    expected = parser.extract_tool_calls(truncated)
+    assert len(expected) == 3
+
+    chunks = [truncated[i : i + 7] for i in range(0, len(truncated), 7)]
+    assert list(parser.iter_tool_calls(chunks)) == expected
+
+
+def test_feed_preserves_tag_split_across_chunks():
+    streamer = StreamingXMLToolParser()
+    calls = []
+    calls += streamer.feed("prose <tool_")
+    calls += streamer.feed("call><function=f><parameter=a>\n1\n</parameter>")
+    assert calls == []
+    calls += streamer.feed("</function></tool_call>")
+    assert calls == [{"tool": "f", "arguments": {"a": "1"}}]
+
+
+def test_flush_parses_unterminated_call():
+    streamer = StreamingXMLToolParser()
+    assert streamer.feed("<tool_call><function=g><parameter=b>\n2\n") == []
+    assert streamer.flush() == [{"tool": "g", "arguments": {"b": "2"}}]
+    # Buffer is reset after flush.
+    assert streamer.flush() == []
+
+
+def test_feed_ignores_plain_text():
+    streamer = StreamingXMLToolParser()
+    assert streamer.feed("no tool calls here, just < a comparison") == []
+    assert streamer.flush() == []